@@ -252,6 +252,25 @@ def _ensure_nets_db() -> None:
         )
         cur.execute("CREATE INDEX IF NOT EXISTS idx_autoquery_callsign ON autoquery_backlog(callsign)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_autoquery_status ON autoquery_backlog(status)")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_autoquery_status_callsign ON autoquery_backlog(status, callsign)"
+        )
+        # One row per (callsign, msg_id, kind) so the JS8 tab can UPSERT; keep the newest
+        # row of any duplicates left behind by the old DELETE+INSERT path.
+        cur.execute(
+            """
+            DELETE FROM autoquery_backlog
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM autoquery_backlog GROUP BY callsign, COALESCE(msg_id, ''), kind
+            )
+            """
+        )
+        cur.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_autoquery_key
+            ON autoquery_backlog(callsign, COALESCE(msg_id, ''), kind)
+            """
+        )
 
         # Peer HF schedule (imported from other operators)
         cur.execute(
@@ -1,16 +1,24 @@
 ﻿from __future__ import annotations
 
+import collections
 import datetime
+import functools
+import heapq
+import itertools
+import os
 import re
 import sqlite3
 import time
 import json
 import queue
 import socket
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, QCoreApplication
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -48,11 +56,8 @@ from freqinout.core.config_paths import get_config_dir
 
 def _nets_db_path() -> Path:
     return get_config_dir() / "config" / "freqinout_nets.db"
-from freqinout.core.config_paths import get_config_dir
 
 
-def _nets_db_path() -> Path:
-    return get_config_dir() / "config" / "freqinout_nets.db"
 import psutil
 
 # Vendored js8net (replacement for pyjs8call)
@@ -68,6 +73,295 @@ except Exception:
 AUTO_GRID_QUIET_SECS = 90  # idle time required since last RX from a station before sending GRID?
 CHECKIN_FORMS = {"F!103", "F!104"}
 ANNOUNCE_FORM = "F!106"  # JS8Spotter net announcement
+_MODE_NAMES = {0: "Normal", 1: "Fast", 2: "Turbo", 4: "Slow"}  # JS8 SPEED -> mode label
+_DB_WRITE_ATTEMPTS = 5  # tries for a queued write that hits "database is locked" before it is dropped
+_DB_FLUSH_TIMEOUT_SECS = 30.0  # max wait for the background writer to drain at shutdown
+# Byte-level markers that make a DIRECTED.TXT line worth decoding while no net is running:
+# announcements, the end-of-message diamond (U+2662), GRID reports, YES MSG replies, @GROUP traffic.
+_DIRECTED_MARKERS_RE = re.compile(rb"F!106|\xe2\x99\xa2|GRID|YES\s+MSG|@", re.IGNORECASE)
+# Per-line/per-message patterns, compiled once
+_GRID_RE = re.compile(r"^[A-R]{2}[0-9]{2}([A-X]{2})?$")  # Maidenhead: 4-char (LLDD) or 6-char (LLDDLL)
+_ID_RE = re.compile(r"\b(\d+)\b")
+_FORM_RE = re.compile(r"F![0-9]{3}")
+_YES_MSG_RE = re.compile(r"\bYES\s+MSG(?:\s+ID)?\s+(\d+)", re.IGNORECASE)
+_CALL_SUFFIX_RE = re.compile(r"/(P|M|MM|QRP|SOTA|ROVER|[A-Z0-9]{1,4})$")
+_DEST_CALL_RE = re.compile(r"^(?=.*[A-Z])[A-Z0-9]{3,}$")
+# First whitespace-delimited "@GROUP" token (same result as scanning text.split())
+_GROUP_TOKEN_RE = re.compile(r"(?:^|\s)@(\S+)")
+# Commas separate GRID report tokens just like whitespace
+_DELIM_TABLE = str.maketrans({",": " "})
+
+# operator_checkins schema (matches core.db_initializer); applied once per shared connection
+OPERATOR_CHECKINS_DDL = """
+CREATE TABLE IF NOT EXISTS operator_checkins (
+    callsign TEXT PRIMARY KEY,
+    name TEXT,
+    state TEXT,
+    grid TEXT,
+    group1 TEXT,
+    group2 TEXT,
+    group3 TEXT,
+    group_role TEXT,
+    first_seen_utc TEXT,
+    last_seen_utc TEXT,
+    last_net TEXT,
+    last_role TEXT,
+    checkin_count INTEGER DEFAULT 0,
+    groups_json TEXT,
+    trusted INTEGER DEFAULT 1
+)
+"""
+
+# Statements reused by the nets DB helpers. Kept as module constants so sqlite3's
+# per-connection statement cache hits on every call.
+SQL_SELECT_OPERATOR_META = "SELECT name, state, grid FROM operator_checkins WHERE callsign=?"
+SQL_SELECT_OPERATOR_GRID = "SELECT grid FROM operator_checkins WHERE callsign=?"
+SQL_SELECT_OPERATOR_GROUPS = """
+SELECT grid, group1, group2, group3, groups_json, trusted FROM operator_checkins WHERE callsign=?
+"""
+SQL_UPSERT_UNTRUSTED = """
+INSERT INTO operator_checkins (
+    callsign, name, state, grid, group1, group2, group3, group_role,
+    first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted
+) VALUES (?, '', '', '', ?, '', '', '', ?, ?, 0, ?, 0)
+ON CONFLICT(callsign) DO UPDATE SET
+    last_seen_utc=excluded.last_seen_utc,
+    group1=COALESCE(NULLIF(operator_checkins.group1,''), excluded.group1),
+    groups_json=COALESCE(operator_checkins.groups_json, excluded.groups_json)
+WHERE COALESCE(operator_checkins.trusted, 0)=0
+"""
+SQL_INCR_CHECKIN = """
+INSERT INTO operator_checkins (callsign, first_seen_utc, last_seen_utc, checkin_count, trusted)
+VALUES (?, ?, ?, 1, 0)
+ON CONFLICT(callsign) DO UPDATE SET
+    checkin_count=COALESCE(operator_checkins.checkin_count, 0) + 1,
+    last_seen_utc=excluded.last_seen_utc
+"""
+SQL_INSERT_OPERATOR_INFO = """
+INSERT INTO operator_checkins (
+    callsign, name, state, grid, group1, group2, group3, group_role,
+    first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted
+) VALUES (?, '', '', ?, ?, ?, ?, '', ?, ?, 0, ?, 0)
+"""
+SQL_UPDATE_OPERATOR_INFO = """
+UPDATE operator_checkins
+SET
+    grid=?,
+    group1=?,
+    group2=?,
+    group3=?,
+    groups_json=?,
+    last_seen_utc=?
+WHERE callsign=?
+"""
+SQL_SELECT_NET_SCHEDULE = (
+    "SELECT day_utc, frequency, start_utc, end_utc, early_checkin, group_name FROM net_schedule_tab"
+)
+SQL_SELECT_DAILY_SCHEDULE = "SELECT day_utc, frequency, start_utc, end_utc, group_name FROM daily_schedule_tab"
+# An existing non-empty grid is kept; trusted defaults to 1 but never overrides a stored value
+SQL_UPSERT_OPERATOR_GRID = """
+INSERT INTO operator_checkins
+(callsign, grid, group1, group2, group3, group_role, first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted)
+VALUES (?, ?, NULL, NULL, NULL, NULL, ?, ?, 0, NULL, 1)
+ON CONFLICT(callsign) DO UPDATE SET
+    grid=COALESCE(NULLIF(operator_checkins.grid, ''), excluded.grid),
+    last_seen_utc=excluded.last_seen_utc,
+    trusted=COALESCE(operator_checkins.trusted, 1)
+"""
+SQL_UPSERT_OPERATOR_GRID_GROUPS = """
+INSERT INTO operator_checkins
+(callsign, grid, group1, group2, group3, group_role, first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted)
+VALUES (?, ?, ?, ?, ?, NULL, ?, ?, 0, ?, 1)
+ON CONFLICT(callsign) DO UPDATE SET
+    grid=COALESCE(NULLIF(operator_checkins.grid, ''), excluded.grid),
+    group1=excluded.group1,
+    group2=excluded.group2,
+    group3=excluded.group3,
+    last_seen_utc=excluded.last_seen_utc,
+    groups_json=excluded.groups_json,
+    trusted=COALESCE(operator_checkins.trusted, 1)
+"""
+# Relies on the unique idx_autoquery_key index; re-queuing resets the entry like a fresh insert
+SQL_BACKLOG_UPSERT = """
+INSERT INTO autoquery_backlog (callsign, msg_id, kind, status, attempts, last_attempt_ts, created_ts)
+VALUES (?, ?, ?, ?, 0, ?, ?)
+ON CONFLICT(callsign, COALESCE(msg_id, ''), kind) DO UPDATE SET
+    msg_id=excluded.msg_id,
+    status=excluded.status,
+    attempts=0,
+    last_attempt_ts=excluded.last_attempt_ts,
+    created_ts=excluded.created_ts
+"""
+SQL_BACKLOG_MARK = """
+UPDATE autoquery_backlog
+SET status=?, last_attempt_ts=?
+WHERE callsign=? AND COALESCE(msg_id,'')=COALESCE(?, '') AND kind=?
+"""
+SQL_BACKLOG_TOUCH = """
+UPDATE autoquery_backlog
+SET attempts=attempts+1, last_attempt_ts=?
+WHERE callsign=? AND COALESCE(msg_id,'')=COALESCE(?, '') AND kind=?
+"""
+
+
+def _utc_now_str() -> str:
+    """
+    Current UTC time as "YYYY-MM-DD HH:MM:SS", formatted from time.gmtime()
+    without building a datetime or going through strftime.
+    """
+    t = time.gmtime()
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
+def _parse_line_ts(ts_str: str) -> datetime.datetime:
+    """
+    Parse a JS8Call 'YYYY-MM-DD HH:MM:SS' log prefix as UTC.
+    Slices the fixed-width fields directly instead of going through strptime.
+    """
+    if len(ts_str) < 19 or ts_str[4] != "-" or ts_str[10] != " " or ts_str[13] != ":":
+        raise ValueError(f"not a JS8 timestamp: {ts_str[:19]!r}")
+    return datetime.datetime(
+        int(ts_str[0:4]),
+        int(ts_str[5:7]),
+        int(ts_str[8:10]),
+        int(ts_str[11:13]),
+        int(ts_str[14:16]),
+        int(ts_str[17:19]),
+        tzinfo=datetime.timezone.utc,
+    )
+
+
+def _line_ts_after(line: str, start_ts: float) -> bool:
+    """
+    Return True if the line begins with a timestamp later than start_ts.
+    """
+    try:
+        return _parse_line_ts(line).timestamp() > start_ts
+    except Exception:
+        return False
+
+
+def _is_message_complete_line(line: str) -> bool:
+    """
+    Heuristic: treat lines containing the JS8Call end-of-message marker
+    (diamond U+2662) as completion markers.
+    """
+    return "\u2662" in line
+
+
+# Schedule day names -> bit (datetime.weekday() order); blank/"ALL" sets every bit
+_DAY_BITS = {
+    name: 1 << i
+    for i, name in enumerate(("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"))
+}
+_ALL_DAYS_MASK = 0x7F
+
+
+def _day_mask(day) -> int:
+    d = str(day or "ALL").strip().upper()
+    if d == "ALL":
+        return _ALL_DAYS_MASK
+    return _DAY_BITS.get(d, 0)
+
+
+def _is_lock_error(e: Exception) -> bool:
+    """
+    True for SQLite busy/locked errors, which are worth retrying.
+    """
+    if not isinstance(e, sqlite3.OperationalError):
+        return False
+    msg = str(e).lower()
+    return "locked" in msg or "busy" in msg
+
+
+def _db_stamp(db_path: Path):
+    """
+    Return a change stamp for a SQLite file, or None if it does not exist.
+    The -wal sidecar is included since WAL commits leave the main file untouched.
+    """
+    try:
+        st = db_path.stat()
+    except OSError:
+        return None
+    try:
+        wst = os.stat(str(db_path) + "-wal")
+        wal = (wst.st_mtime_ns, wst.st_size)
+    except OSError:
+        wal = None
+    return (st.st_mtime_ns, st.st_size, wal)
+
+
+def _reopen_if_rotated(fh, path: Path, st: os.stat_result):
+    """
+    Return (handle, rotated) for a persistent binary tail handle on `path`.
+    The handle is reopened only when the file was replaced (inode change).
+    """
+    rotated = False
+    if fh is not None:
+        try:
+            if os.fstat(fh.fileno()).st_ino != st.st_ino:
+                fh.close()
+                fh = None
+                rotated = True
+        except (OSError, ValueError):
+            fh = None
+            rotated = True
+    if fh is None:
+        fh = path.open("rb")
+    return fh, rotated
+
+
+class _DirectedReader(QObject):
+    """
+    Reads new DIRECTED.TXT lines off the GUI thread.
+
+    Owns the persistent file handle and does the byte-level prefilter, decode,
+    app-start timestamp filter and tab split. Each read posts one batch of
+    (line, parts, upper-cased line, complete) records back to the GUI thread.
+    """
+
+    batch_ready = Signal(int, int, list)  # (generation, new offset, records)
+
+    def __init__(self):
+        super().__init__()
+        self._fh = None
+
+    def read(self, gen: int, path: Path, offset: int, prefilter: bool, mycall_b: bytes, start_ts: float) -> None:
+        records = []
+        try:
+            st = os.stat(path)
+            if st.st_size < offset:
+                # File truncated; re-read from start
+                offset = 0
+            self._fh, rotated = _reopen_if_rotated(self._fh, path, st)
+            if rotated:
+                offset = 0
+            self._fh.seek(offset)
+            for raw in self._fh:
+                if prefilter and not _DIRECTED_MARKERS_RE.search(raw):
+                    if not mycall_b or mycall_b not in raw.upper():
+                        continue
+                line = raw.decode("utf-8", "ignore").strip()
+                if not line:
+                    continue
+                if not _line_ts_after(line, start_ts):
+                    log.debug("JS8 NCS: skipping DIRECTED line before app start: %s", line)
+                    continue
+                records.append(
+                    (line, line.split("\t", 4), line.upper(), _is_message_complete_line(line))
+                )
+            offset = self._fh.tell()
+        except Exception as e:
+            log.error("JS8CallNetControl: failed reading DIRECTED.TXT: %s", e)
+        self.batch_ready.emit(gen, offset, records)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
 
 
 class JS8CallNetControlTab(QWidget):
@@ -100,6 +394,9 @@ class JS8CallNetControlTab(QWidget):
         * Prefills net name if the field is empty and no net is in progress.
     """
 
+    # Emitted from the background writer once a queued grid write commits or is dropped
+    grid_write_done = Signal(str, bool)  # (base callsign, committed)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = SettingsManager()
@@ -109,12 +406,57 @@ class JS8CallNetControlTab(QWidget):
         self._net_end_utc: str | None = None
 
         self._directed_path: Path | None = None
+        # Persistent binary handle for ALL.TXT, reopened only on rotation. DIRECTED.TXT is
+        # tailed by a single-worker reader so file I/O and parsing stay off the GUI thread;
+        # the generation counter discards batches read against an offset since reset.
+        self._all_fh = None
+        self._directed_reader = _DirectedReader()
+        self._directed_reader.batch_ready.connect(self._on_directed_batch)
+        self._directed_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="js8-directed")
+        self._directed_gen: int = 0
+        self._directed_read_pending: bool = False
+        # DB locations are resolved once; get_config_dir() mkdirs on every call
+        self._db_path: Path = _nets_db_path()
+        self._daily_db_path: Path = get_config_dir() / "config" / "freqinout.db"
+        # Shared freqinout_nets.db connection, opened lazily by _db()
+        self._db_conn: sqlite3.Connection | None = None
+        # Read-only freqinout.db connection for the daily schedule, opened lazily
+        self._daily_db_conn: sqlite3.Connection | None = None
+        self._db_batch_depth: int = 0
+        # (file stamp, rows) memo for the schedule tables; see _db_stamp()
+        self._net_rows_cache: tuple | None = None
+        self._daily_rows_cache: tuple | None = None
+        # 1 s memo for _active_schedule / _next_net_lockout (several calls per UI tick)
+        self._sched_cache_ts: float = 0.0
+        self._sched_cache_val: Optional[Dict] = None
+        self._lockout_cache_ts: float = 0.0
+        self._lockout_cache_val: Optional[datetime.datetime] = None
+        # Backlog and operator-grid writes are queued and applied by a background writer
+        # on its own connection, in batches, so they never block the GUI thread.
+        self._wq: queue.Queue = queue.Queue()
+        self.grid_write_done.connect(self._on_grid_write_done)
+        self._db_writer_thread = threading.Thread(
+            target=self._db_writer_loop, name="js8-backlog-writer", daemon=True
+        )
+        self._db_writer_thread.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._close_db_connections)
+        # Upper-cased primary + operating groups, rebuilt lazily after settings load
+        self._allowed_groups_cache: frozenset[str] | None = None
+        # Upper-cased operator callsign, re-read from settings after _load_settings()
+        self._mycall_cached: str | None = None
+        # operating_groups bucketed by frequency rounded to kHz (MHz, 3 places)
+        self._op_group_by_mhz: Dict[float, str] | None = None
         self._last_directed_size: int = 0
         self._startup_directed_size: int = 0
 
         self._all_calls_seen: Set[str] = set()
         self._queried_msg_ids: Set[str] = set()
-        self._pending_queries: List[tuple[Optional[float], Optional[int], str, str]] = []
+        # Min-heap of (snr sort key, seq, snr, speed, call, msg_id): weakest SNR first,
+        # unknown SNR last, FIFO among ties
+        self._pending_queries: List[tuple[float, int, Optional[float], Optional[int], str, str]] = []
+        self._pending_query_seq = itertools.count()
         self._waiting_for_completion: bool = False
         self._current_query: tuple[str, str] | None = None
         self._js8_client = None
@@ -122,7 +464,9 @@ class JS8CallNetControlTab(QWidget):
         self.auto_query_grids = bool(self.settings.get("js8_auto_query_grids", False))
         self._js8_rx_timer: QTimer | None = None
         self._last_rx_ts: float = 0.0
-        self._pending_grid_queries: List[tuple[Optional[float], str]] = []
+        # Min-heap of (weakest-SNR key, seq, snr, call) plus a membership set for dedupe
+        self._pending_grid_queries: List[tuple[float, int, Optional[float], str]] = []
+        self._pending_grid_calls: set[str] = set()
         self._grid_waiting: bool = False
         self._grid_last_rx_ts: float = 0.0
         self._last_directed_size: int = 0
@@ -151,6 +495,12 @@ class JS8CallNetControlTab(QWidget):
         self._recent_announcements: Dict[str, float] = {}  # callsign -> last popup ts
         self._backlog_loaded: bool = False
         self._awaiting_msg_responses: Dict[tuple[str, str], float] = {}  # (call, msg_id) -> expiry ts
+        self._awaiting_msg_by_call: Dict[str, Set[str]] = {}  # call -> msg_ids, index over the above
+        # Memoized _operator_missing_grid answers (base callsigns); cleared at net end
+        self._grid_known: Set[str] = set()
+        self._grid_missing: Set[str] = set()
+        # Grids queued for the background writer but not yet committed
+        self._grid_pending: Set[str] = set()
         self._awaiting_grid_responses: Dict[str, float] = {}  # call -> expiry ts
         self._current_query_sent_ts: float = 0.0
         self._qsy_options: Dict[str, Dict] = {}
@@ -326,8 +676,19 @@ class JS8CallNetControlTab(QWidget):
         self._refresh_auto_query_flags()
         self._maybe_reload_operating_groups()
 
+    def _invalidate_group_cache(self) -> None:
+        self._allowed_groups_cache = None
+        self._op_group_by_mhz = None
+        self._mycall_cached = None
+
+    def _invalidate_schedule_cache(self) -> None:
+        self._sched_cache_ts = 0.0
+        self._lockout_cache_ts = 0.0
+
     def _load_settings(self):
         data = self.settings.all()
+        self._invalidate_group_cache()
+        self._invalidate_schedule_cache()
         self.auto_query_msg_id = bool(data.get("js8_auto_query_msg_id", False))
         self.auto_query_grids = bool(data.get("js8_auto_query_grids", False))
 
@@ -346,16 +707,21 @@ class JS8CallNetControlTab(QWidget):
         if directed_path:
             p = Path(directed_path)
             if p.exists() and p.is_file():
+                if p != self._directed_path:
+                    self._close_tail_handles()
                 self._directed_path = p
                 try:
                     self._startup_directed_size = p.stat().st_size
                     self._last_directed_size = self._startup_directed_size
+                    self._directed_gen += 1
                 except Exception:
                     self._startup_directed_size = 0
             else:
+                self._close_tail_handles()
                 self._directed_path = None
                 log.warning("JS8CallNetControl: js8_directed_path not found: %s", directed_path)
         else:
+            self._close_tail_handles()
             self._directed_path = None
 
         # Refresh interval
@@ -644,6 +1010,7 @@ class JS8CallNetControlTab(QWidget):
         self._waiting_for_completion = False
         self._current_query = None
         self._pending_grid_queries.clear()
+        self._pending_grid_calls.clear()
         self._grid_waiting = False
         self._awaiting_ack_for = None
         self._call_last_rx_ts.clear()
@@ -663,6 +1030,7 @@ class JS8CallNetControlTab(QWidget):
         try:
             if self._directed_path:
                 self._last_directed_size = self._directed_path.stat().st_size
+                self._directed_gen += 1
                 all_path = self._directed_path.parent / "ALL.TXT"
                 self._last_all_size = all_path.stat().st_size if all_path.exists() else 0
         except Exception:
@@ -734,6 +1102,8 @@ class JS8CallNetControlTab(QWidget):
         self._checkins.clear()
         self._checkin_rows.clear()
         self._checkins_saved.clear()
+        self._grid_known.clear()
+        self._grid_missing.clear()
         self._clear_table()
         QMessageBox.information(self, "Net Ended", "JS8Call net ended and log saved.")
 
@@ -800,141 +1170,161 @@ class JS8CallNetControlTab(QWidget):
         self._poll_all_for_query_tx()
         log.debug("JS8CallNetControl: last query TX ts=%s", self._last_query_tx_ts)
 
-        try:
-            size_now = self._directed_path.stat().st_size
-        except Exception as e:
-            log.error("JS8CallNetControl: stat DIRECTED.TXT failed: %s", e)
-            return
-
-        if size_now < self._last_directed_size:
-            # File truncated or rotated; re-read from start
-            self._last_directed_size = 0
-
         # Drop stale pending announcements
         now_ts = time.time()
-        for k, ts in list(self._pending_announcements.items()):
-            if now_ts - ts > 60:
-                self._pending_announcements.pop(k, None)
+        expired = [k for k, ts in self._pending_announcements.items() if now_ts - ts > 60]
+        for k in expired:
+            self._pending_announcements.pop(k, None)
         # Expire pending query waits
         self._expire_pending_responses()
 
-        try:
-            with self._directed_path.open("r", encoding="utf-8", errors="ignore") as f:
-                if self._last_directed_size > 0:
-                    f.seek(self._last_directed_size)
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if not self._line_ts_after_start(line):
-                        log.debug("JS8 NCS: skipping DIRECTED line before app start: %s", line)
-                        continue
-                    # Load pending backlog for seen calls if applicable
-                    calls = self._extract_callsigns_from_line(line)
-                    if self._net_in_progress and not self._auto_query_paused_by_net:
-                        pending_items = self._backlog_fetch_pending(calls)
-                        for cs_b, mid_b, kind_b in pending_items:
-                            if kind_b == "MSG" and mid_b:
-                                self._pending_queries.append((None, None, cs_b, mid_b))
-                                self._backlog_touch_attempt(cs_b, mid_b, "MSG")
-                            elif kind_b == "GRID":
-                                self._pending_grid_queries.append((None, cs_b))
-                                self._backlog_touch_attempt(cs_b, mid_b, "GRID")
-                    # Net announcement detection (only when net not in progress)
-                    if self._line_has_announce_form(line):
-                        # If message completion marker present, notify immediately; else mark pending
-                        call_primary = calls[0] if calls else ""
-                        if self._is_message_complete_line(line):
-                            log.debug(
-                                "JS8 NCS: F!106 complete line detected (net_in_progress=%s): %s",
-                                self._net_in_progress,
-                                line,
-                            )
-                            self._maybe_notify_announcement(call_primary, line)
-                        else:
-                            log.debug("JS8 NCS: F!106 partial line, waiting for completion: %s", line)
-                            self._pending_announcements[(call_primary or "UNKNOWN")] = time.time()
-                    # If a completion marker arrives, see if we had a pending announcement for this call
-                    if self._is_message_complete_line(line) and self._pending_announcements:
-                        call_primary = calls[0] if calls else "UNKNOWN"
-                        pending_ts = self._pending_announcements.pop(call_primary, None)
-                        if pending_ts:
-                            log.debug(
-                                "JS8 NCS: F!106 completion arrived for pending call %s (net_in_progress=%s): %s",
-                                call_primary,
-                                self._net_in_progress,
-                                line,
-                            )
-                            self._maybe_notify_announcement(call_primary, line)
-                    self._maybe_capture_grid_report(line)
-                    self._maybe_record_inbound_trigger(line, calls)
-                    msg_ids = self._extract_message_ids(line)
-                    # If multiple stations reported YES MSG <id>, query each (only when addressed to us)
-                    mycall = self._my_callsign()
-                    if msg_ids and calls:
-                        dest_cs = ""
-                        try:
-                            msg_field = line.split("\t", 4)[4]
-                            if ":" in msg_field:
-                                dest_cs = msg_field.split(":", 1)[1].strip().split()[0].strip().upper()
-                        except Exception:
-                            dest_cs = ""
-                        if not mycall:
-                            log.info("JS8CallNetControl: YES MSG line but no mycall set; skipping: %s", line.strip())
-                        elif dest_cs != mycall:
-                            log.info(
-                                "JS8CallNetControl: YES MSG line addressed to %s (not %s); skipping",
-                                dest_cs or "(unknown)",
-                                mycall,
-                            )
-                        else:
-                            for c in calls:
-                                base_c = self._base_callsign(c)
-                                speed_guess = self._call_last_speed.get(base_c)
-                                for mid in msg_ids:
-                                    log.info(
-                                        "JS8CallNetControl: queueing auto-query id=%s from %s (dest=%s speed=%s)",
-                                        mid,
-                                        c,
-                                        dest_cs,
-                                        speed_guess,
-                                    )
-                                    self._queue_auto_query(c, mid, speed=speed_guess)
-                    call_primary = calls[0] if calls else ""
-                    if not call_primary:
-                        continue
-
-                    # During an active net, record/update the check-in row
-                    if self._net_in_progress:
-                        if not self._line_has_checkin_form(line) and call_primary not in self._checkins:
-                            continue
-                        snr_line, dt_line, offset_line = self._parse_directed_metrics(line)
-                        speed_guess = self._call_last_speed.get(self._base_callsign(call_primary))
-                        mode_name = ""
-                        if speed_guess is not None:
-                            mode_name = {0: "Normal", 1: "Fast", 2: "Turbo", 4: "Slow"}.get(
-                                speed_guess, str(speed_guess)
-                            )
-                        self._upsert_checkin(
-                            call_primary,
-                            status="NEW",
-                            mode=mode_name or None,
-                            snr=snr_line,
-                            dt_ms=dt_line,
-                            offset=offset_line,
-                        )
+        if self._directed_read_pending:
+            # Previous read still running on the worker; its batch covers the new lines too
+            return
+        # Outside a net only marker lines (or lines mentioning us) matter; the worker rejects
+        # the rest before paying for the UTF-8 decode.
+        self._directed_read_pending = True
+        self._directed_pool.submit(
+            self._directed_reader.read,
+            self._directed_gen,
+            self._directed_path,
+            self._last_directed_size,
+            not self._net_in_progress,
+            self._my_callsign().encode("utf-8"),
+            self._app_start_ts,
+        )
 
-                    # Check for completion markers to advance queue
-                    self._process_message_completion(line)
+    def _on_directed_batch(self, gen: int, offset: int, records: list):
+        """
+        Handle one batch of parsed DIRECTED.TXT lines posted back from the reader thread.
+        Check-in table, queue and DB updates stay on the GUI thread.
+        """
+        self._directed_read_pending = False
+        if gen != self._directed_gen:
+            # Offset was reset (net start / settings reload) while the read was in flight
+            return
+        self._last_directed_size = offset
+        calls_per_record = [self._extract_callsigns_from_line(line, parts=parts) for line, parts, _u, _c in records]
+        # Pending backlog for every call in the batch, fetched in one query
+        pending_by_call: Dict[str, List[tuple[str, str, str]]] = {}
+        if self._net_in_progress and not self._auto_query_paused_by_net:
+            pending_by_call = self._backlog_pending_by_call({c for calls in calls_per_record for c in calls})
+        with self._db_batch():
+            for (line, parts, up, complete), calls in zip(records, calls_per_record):
+                try:
+                    self._handle_directed_record(line, parts, up, complete, calls, pending_by_call)
+                except Exception as e:
+                    # One bad line must not drop the rest of the batch; the offset has moved past it
+                    log.error("JS8CallNetControl: failed handling DIRECTED line %r: %s", line, e)
 
-                self._last_directed_size = f.tell()
-        except Exception as e:
-            log.error("JS8CallNetControl: failed reading DIRECTED.TXT: %s", e)
+    def _handle_directed_record(
+        self,
+        line: str,
+        parts: List[str],
+        up: str,
+        complete: bool,
+        calls: List[str],
+        pending_by_call: Dict[str, List[tuple[str, str, str]]],
+    ) -> None:
+        """
+        Apply one DIRECTED.TXT record: backlog retries, announcements, grid
+        reports, auto-queries, check-in updates and query completion.
+        """
+        msg_field = parts[4] if len(parts) >= 5 else ""
+        # Load pending backlog for seen calls if applicable
+        if pending_by_call:
+            pending_items = [item for c in calls for item in pending_by_call.get(c.upper(), ())]
+            for cs_b, mid_b, kind_b in pending_items:
+                if kind_b == "MSG" and mid_b:
+                    self._push_pending_query(None, None, cs_b, mid_b)
+                    self._backlog_touch_attempt(cs_b, mid_b, "MSG")
+                elif kind_b == "GRID":
+                    if cs_b not in self._pending_grid_calls:
+                        self._push_pending_grid(None, cs_b)
+                    self._backlog_touch_attempt(cs_b, mid_b, "GRID")
+        # Net announcement detection (only when net not in progress)
+        if self._line_has_announce_form(line, up=up):
+            # If message completion marker present, notify immediately; else mark pending
+            call_primary = calls[0] if calls else ""
+            if complete:
+                log.debug(
+                    "JS8 NCS: F!106 complete line detected (net_in_progress=%s): %s",
+                    self._net_in_progress,
+                    line,
+                )
+                self._maybe_notify_announcement(call_primary, line)
+            else:
+                log.debug("JS8 NCS: F!106 partial line, waiting for completion: %s", line)
+                self._pending_announcements[(call_primary or "UNKNOWN")] = time.time()
+        # If a completion marker arrives, see if we had a pending announcement for this call
+        if complete and self._pending_announcements:
+            call_primary = calls[0] if calls else "UNKNOWN"
+            pending_ts = self._pending_announcements.pop(call_primary, None)
+            if pending_ts:
+                log.debug(
+                    "JS8 NCS: F!106 completion arrived for pending call %s (net_in_progress=%s): %s",
+                    call_primary,
+                    self._net_in_progress,
+                    line,
+                )
+                self._maybe_notify_announcement(call_primary, line)
+        self._maybe_capture_grid_report(line, parts=parts, up=up)
+        self._maybe_record_inbound_trigger(line, calls, up=up)
+        msg_ids = self._extract_message_ids(line)
+        # If multiple stations reported YES MSG <id>, query each (only when addressed to us)
+        mycall = self._my_callsign()
+        if msg_ids and calls:
+            dest_cs = ""
+            try:
+                if ":" in msg_field:
+                    dest_cs = msg_field.split(":", 1)[1].strip().split()[0].strip().upper()
+            except Exception:
+                dest_cs = ""
+            if not mycall:
+                log.info("JS8CallNetControl: YES MSG line but no mycall set; skipping: %s", line.strip())
+            elif dest_cs != mycall:
+                log.info(
+                    "JS8CallNetControl: YES MSG line addressed to %s (not %s); skipping",
+                    dest_cs or "(unknown)",
+                    mycall,
+                )
+            else:
+                for c in calls:
+                    base_c = self._base_callsign(c)
+                    speed_guess = self._call_last_speed.get(base_c)
+                    for mid in msg_ids:
+                        log.info(
+                            "JS8CallNetControl: queueing auto-query id=%s from %s (dest=%s speed=%s)",
+                            mid,
+                            c,
+                            dest_cs,
+                            speed_guess,
+                        )
+                        self._queue_auto_query(c, mid, speed=speed_guess)
+        call_primary = calls[0] if calls else ""
+        if not call_primary:
             return
 
-        # If no net in progress, skip UI updates (auto-query can still run)
-        if not self._net_in_progress:
-            return
+        # During an active net, record/update the check-in row
+        if self._net_in_progress:
+            if not self._line_has_checkin_form(line, up=up) and call_primary not in self._checkins:
+                return
+            snr_line, dt_line, offset_line = self._parse_directed_metrics(line)
+            speed_guess = self._call_last_speed.get(self._base_callsign(call_primary))
+            mode_name = ""
+            if speed_guess is not None:
+                mode_name = _MODE_NAMES.get(speed_guess, str(speed_guess))
+            self._upsert_checkin(
+                call_primary,
+                status="NEW",
+                mode=mode_name or None,
+                snr=snr_line,
+                dt_ms=dt_line,
+                offset=offset_line,
+            )
+
+        # Check for completion markers to advance queue
+        self._process_message_completion(line, complete=complete)
 
     def _poll_all_for_query_tx(self):
         """
@@ -945,52 +1335,71 @@ class JS8CallNetControlTab(QWidget):
         if not self._directed_path:
             return
         all_path = self._directed_path.parent / "ALL.TXT"
-        if not all_path.exists():
-            return
         try:
-            size_now = all_path.stat().st_size
+            st = os.stat(all_path)
+        except FileNotFoundError:
+            return
         except Exception as e:
             log.error("JS8CallNetControl: stat ALL.TXT failed: %s", e)
             return
-        if size_now < self._last_all_size:
+        if st.st_size < self._last_all_size:
             self._last_all_size = 0
         try:
-            with all_path.open("r", encoding="utf-8", errors="ignore") as f:
-                if self._last_all_size > 0:
-                    f.seek(self._last_all_size)
-                for line in f:
-                    if "Transmitting" not in line:
-                        continue
-                    if not self._line_ts_after_start(line):
-                        continue
-                    up = line.upper()
-                    mycall = self._my_callsign()
-                    if mycall and f"{mycall}:" in up:
-                        self._last_tx_ts = time.time()
-                    if "QUERY MSG" in up:
-                        self._last_query_tx_ts = time.time()
-                        log.info("JS8CallNetControl: detected outgoing QUERY MSG in ALL.TXT: %s", line.strip())
-                    # Detect outbound ACK to release pending QUERY MSGS
-                    if "ACK" in up and mycall and f"{mycall}:" in up:
+            self._all_fh, rotated = _reopen_if_rotated(self._all_fh, all_path, st)
+            f = self._all_fh
+            if rotated:
+                self._last_all_size = 0
+            f.seek(self._last_all_size)
+            for raw in f:
+                # Only our own transmissions matter; skip decoding everything else
+                if b"Transmitting" not in raw:
+                    continue
+                line = raw.decode("utf-8", "ignore")
+                if not self._line_ts_after_start(line):
+                    continue
+                up = line.upper()
+                mycall = self._my_callsign()
+                if mycall and f"{mycall}:" in up:
+                    self._last_tx_ts = time.time()
+                if "QUERY MSG" in up:
+                    self._last_query_tx_ts = time.time()
+                    log.info("JS8CallNetControl: detected outgoing QUERY MSG in ALL.TXT: %s", line.strip())
+                # Detect outbound ACK to release pending QUERY MSGS
+                if "ACK" in up and mycall and f"{mycall}:" in up:
+                    dest = ""
+                    try:
+                        msg_part = line.split("JS8:", 1)[1]
+                        rest = msg_part.split(":", 1)[1]
+                        dest = rest.strip().split()[0].strip().upper()
+                    except Exception:
                         dest = ""
-                        try:
-                            msg_part = line.split("JS8:", 1)[1]
-                            rest = msg_part.split(":", 1)[1]
-                            dest = rest.strip().split()[0].strip().upper()
-                        except Exception:
-                            dest = ""
-                        if dest and self._awaiting_ack_for and dest == self._awaiting_ack_for:
-                            log.info("JS8CallNetControl: ACK sent to %s; issuing follow-up QUERY MSGS", dest)
-                            self._awaiting_ack_for = None
-                            self._send_query_msgs(dest)
-                            self._maybe_process_next_query()
-                    # Track outbound direct transmissions to add untrusted operators
-                    self._maybe_register_outgoing_call(line)
-                self._last_all_size = f.tell()
+                    if dest and self._awaiting_ack_for and dest == self._awaiting_ack_for:
+                        log.info("JS8CallNetControl: ACK sent to %s; issuing follow-up QUERY MSGS", dest)
+                        self._awaiting_ack_for = None
+                        self._send_query_msgs(dest)
+                        self._maybe_process_next_query()
+                # Track outbound direct transmissions to add untrusted operators
+                self._maybe_register_outgoing_call(line)
+            self._last_all_size = f.tell()
         except Exception as e:
             log.error("JS8CallNetControl: failed reading ALL.TXT: %s", e)
             return
 
+    def _close_tail_handles(self) -> None:
+        """
+        Drop the persistent DIRECTED/ALL.TXT handles (DIRECTED is closed on its reader thread).
+        """
+        if self._all_fh is not None:
+            try:
+                self._all_fh.close()
+            except Exception:
+                pass
+            self._all_fh = None
+        self._directed_gen += 1
+        # _directed_read_pending stays set: an in-flight read still posts its (now
+        # stale) batch, which clears the flag before any new-generation read runs.
+        self._directed_pool.submit(self._directed_reader.close)
+
     def _saw_recent_query_tx(self, window_sec: int = 600) -> bool:
         """
         Return True if a QUERY MSG(S) transmit was seen in ALL.TXT within the last window.
@@ -1003,13 +1412,7 @@ class JS8CallNetControlTab(QWidget):
         """
         Return True if the line begins with a timestamp after app start.
         """
-        try:
-            ts_str = line[:19]
-            ts = datetime.datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=datetime.timezone.utc).timestamp()
-            log.debug("JS8CallNetControl: parsed line ts=%s (app_start=%s)", ts, self._app_start_ts)
-            return ts > self._app_start_ts
-        except Exception:
-            return False
+        return _line_ts_after(line, self._app_start_ts)
 
     # ---------------- CHECK-IN TABLE HELPERS ---------------- #
 
@@ -1078,24 +1481,105 @@ class JS8CallNetControlTab(QWidget):
         }
         return fema.get(st, "")
 
+    # ---------------- Nets DB ---------------- #
+
+    def _db(self) -> sqlite3.Connection:
+        """
+        Return the shared freqinout_nets.db connection, opening it on first use.
+        PRAGMAs and the operator_checkins DDL run once here rather than per call.
+        """
+        if self._db_conn is None:
+            db_path = self._db_path
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute(OPERATOR_CHECKINS_DDL)
+            conn.commit()
+            self._db_conn = conn
+        return self._db_conn
+
+    def _daily_db(self) -> sqlite3.Connection:
+        """
+        Return the shared freqinout.db connection used for daily schedule reads.
+        """
+        if self._daily_db_conn is None:
+            self._daily_db_conn = sqlite3.connect(self._daily_db_path, cached_statements=64)
+        return self._daily_db_conn
+
+    def _close_db_connections(self) -> None:
+        """
+        Flush queued backlog writes and close the shared connections (app shutdown).
+        """
+        self._flush_db_writes()
+        for attr in ("_db_conn", "_daily_db_conn"):
+            conn = getattr(self, attr)
+            if conn is None:
+                continue
+            try:
+                if conn.in_transaction:
+                    conn.commit()
+                conn.close()
+            except Exception as e:
+                log.debug("JS8CallNetControl: closing %s failed: %s", attr, e)
+            setattr(self, attr, None)
+
+    def _db_commit(self) -> None:
+        """
+        Commit now unless an enclosing _db_batch() will commit for us.
+        """
+        if self._db_batch_depth == 0:
+            self._db().commit()
+
+    @contextmanager
+    def _db_batch(self):
+        """
+        Group the writes of one RX/DIRECTED drain or check-in save into a single
+        transaction (one journal sync per burst instead of one per helper call).
+        """
+        self._db_batch_depth += 1
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self._db_batch_depth -= 1
+            if self._db_batch_depth == 0 and self._db_conn is not None:
+                try:
+                    if ok:
+                        self._db_conn.commit()
+                    else:
+                        self._db_conn.rollback()
+                except Exception as e:
+                    log.error("JS8CallNetControl: failed to commit DB batch: %s", e)
+
+    def _db_rollback(self) -> None:
+        """
+        Discard a half-applied write so it is not committed by the next caller.
+        Inside a batch the failed statement has already been undone by SQLite, and
+        rolling back here would also drop the batch's earlier writes.
+        """
+        if self._db_conn is not None and self._db_batch_depth == 0:
+            try:
+                self._db_conn.rollback()
+            except Exception:
+                pass
+
     def _lookup_operator_meta(self, callsign: str) -> Dict[str, str]:
         meta = {"name": "", "state": "", "grid": "", "region": ""}
         cs = (callsign or "").strip().upper()
         if not cs:
             return meta
         try:
-            root = Path(__file__).resolve().parents[2]
-            db_path = _nets_db_path()
-            if not db_path.exists():
-                return meta
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
+            cur = self._db().cursor()
             cur.execute(
-                "SELECT name, state, grid FROM operator_checkins WHERE callsign=?",
+                SQL_SELECT_OPERATOR_META,
                 (cs,),
             )
             row = cur.fetchone()
-            conn.close()
             if row:
                 meta["name"] = row[0] or ""
                 meta["state"] = (row[1] or "").upper()
@@ -1167,10 +1651,20 @@ class JS8CallNetControlTab(QWidget):
         if not cs:
             return
         base = cs.split("/", 1)[0]
-        meta = self._lookup_operator_meta(base)
+        data = self._checkins.get(base, {})
+        # Operator meta does not change during a net; only hit the DB for new calls
+        # or when a grid arrives from outside.
+        if data and not grid and data.get("name") is not None and data.get("state") is not None:
+            meta = {
+                "name": data.get("name", ""),
+                "state": data.get("state", ""),
+                "grid": data.get("grid", ""),
+                "region": data.get("region", ""),
+            }
+        else:
+            meta = self._lookup_operator_meta(base)
         if grid:
             meta["grid"] = grid
-        data = self._checkins.get(base, {})
         current_status = (data.get("status") or "").upper()
         # Do not downgrade from ACKED/F!xxx to NEW
         if status:
@@ -1283,12 +1777,14 @@ class JS8CallNetControlTab(QWidget):
         Increment check-in counters for current check-ins (once per net).
         """
         try:
-            for cs in self._checkins.keys():
-                base = cs.split("/", 1)[0]
-                if base in self._checkins_saved:
-                    continue
-                self._increment_checkin_counter(base)
-                self._checkins_saved.add(base)
+            # One transaction for the whole roster instead of a commit per operator
+            with self._db_batch():
+                for cs in self._checkins.keys():
+                    base = cs.split("/", 1)[0]
+                    if base in self._checkins_saved:
+                        continue
+                    self._increment_checkin_counter(base)
+                    self._checkins_saved.add(base)
         except Exception as e:
             log.error("JS8CallNetControl: save checkins failed: %s", e)
         if show_message:
@@ -1409,22 +1905,23 @@ class JS8CallNetControlTab(QWidget):
         return None
 
     def _my_callsign(self) -> str:
-        return (
-            (self.settings.get("operator_callsign", "") or self.settings.get("callsign", "") or "")
-            .strip()
-            .upper()
-        )
+        if self._mycall_cached is None:
+            self._mycall_cached = (
+                (self.settings.get("operator_callsign", "") or self.settings.get("callsign", "") or "")
+                .strip()
+                .upper()
+            )
+        return self._mycall_cached
 
     @staticmethod
+    @functools.lru_cache(maxsize=2048)
     def _base_callsign(cs: str) -> str:
-        import re
-
         cs_norm = (cs or "").strip().upper()
         if not cs_norm:
             return ""
-        return re.sub(r"/(P|M|MM|QRP|SOTA|ROVER|[A-Z0-9]{1,4})$", "", cs_norm)
+        return _CALL_SUFFIX_RE.sub("", cs_norm)
 
-    def _extract_callsigns_from_line(self, line: str) -> List[str]:
+    def _extract_callsigns_from_line(self, line: str, parts: Optional[List[str]] = None) -> List[str]:
         """
         JS8Check-in line examples:
 
@@ -1436,6 +1933,8 @@ class JS8CallNetControlTab(QWidget):
           - If line contains 'F!103', treat first token up to ':' as callsign.
           - Else, if any token ends with ':', treat that token (without ':')
             as the remote callsign, as long as it's not our own callsign.
+
+        `parts` may carry the caller's existing line.split("\t", 4) result.
         """
         line = line.strip()
         if not line:
@@ -1443,10 +1942,10 @@ class JS8CallNetControlTab(QWidget):
 
         mycall = self._my_callsign()
         msg = line
-        if "\t" in line:
+        if parts is None and "\t" in line:
             parts = line.split("\t", 4)
-            if len(parts) >= 5:
-                msg = parts[4].strip()
+        if parts and len(parts) >= 5:
+            msg = parts[4].strip()
 
         # Try F!103 pattern first
         if "F!103" in msg:
@@ -1470,7 +1969,7 @@ class JS8CallNetControlTab(QWidget):
         Look for all patterns like 'YES MSG 123' in a JS8Call line and
         return numeric message IDs as strings.
         """
-        return re.findall(r"\bYES\s+MSG(?:\s+ID)?\s+(\d+)", line, flags=re.IGNORECASE)
+        return _YES_MSG_RE.findall(line)
 
     def _parse_directed_metrics(self, line: str) -> tuple[Optional[float], Optional[float], Optional[int]]:
         """
@@ -1528,7 +2027,7 @@ class JS8CallNetControlTab(QWidget):
             log.error("JS8CallNetControl: failed to start js8net: %s", e)
             return None
 
-    def _maybe_record_inbound_trigger(self, line: str, calls: List[str]) -> None:
+    def _maybe_record_inbound_trigger(self, line: str, calls: List[str], up: Optional[str] = None) -> None:
         """
         Track the group that caused our potential autoreply so we can tag outbound inserts.
         If message was to our callsign, store group = our callsign.
@@ -1537,7 +2036,7 @@ class JS8CallNetControlTab(QWidget):
         if not calls:
             return
         mycall = self._my_callsign()
-        upper = line.upper()
+        upper = up if up is not None else line.upper()
         to_me = mycall and mycall in upper
         groups_cfg = [g.strip().upper() for g in (self.settings.get("primary_js8_groups", []) or []) if g]
         hit_group = None
@@ -1565,12 +2064,6 @@ class JS8CallNetControlTab(QWidget):
         For any outgoing transmission to a callsign, add to operator_checkins as untrusted
         if not already present. Use group from the triggering inbound if available.
         """
-        # Parse timestamp
-        ts = None
-        try:
-            ts = datetime.datetime.strptime(line[:19], "%Y-%m-%d %H:%M:%S").replace(tzinfo=datetime.timezone.utc)
-        except Exception:
-            ts = datetime.datetime.now(datetime.timezone.utc)
         # Extract message after "JS8:"
         if "JS8:" not in line:
             return
@@ -1592,7 +2085,7 @@ class JS8CallNetControlTab(QWidget):
         if not dest_call:
             return
         # Only proceed if dest looks like a normal callsign (must contain a letter; avoid pure digits/macros)
-        if not re.match(r"^(?=.*[A-Z])[A-Z0-9]{3,}$", dest_call):
+        if not _DEST_CALL_RE.match(dest_call):
             return
         # Determine group from last trigger if recent
         group_val = ""
@@ -1606,6 +2099,11 @@ class JS8CallNetControlTab(QWidget):
         if dest_call in self._auto_inserted_callsigns:
             return
         self._auto_inserted_callsigns.add(dest_call)
+        # Timestamp is only needed once we actually insert
+        try:
+            ts = _parse_line_ts(line)
+        except Exception:
+            ts = datetime.datetime.now(datetime.timezone.utc)
         self._maybe_insert_untrusted(dest_call, ts, group_val)
 
     def _maybe_insert_untrusted(self, callsign: str, last_seen: datetime.datetime, group_val: str) -> None:
@@ -1613,157 +2111,84 @@ class JS8CallNetControlTab(QWidget):
         if not cs:
             return
         try:
-            root = Path(__file__).resolve().parents[2]
-            db_path = _nets_db_path()
-            conn = sqlite3.connect(db_path)
+            conn = self._db()
             cur = conn.cursor()
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS operator_checkins (
-                    callsign TEXT PRIMARY KEY,
-                    name TEXT,
-                    state TEXT,
-                    grid TEXT,
-                    group1 TEXT,
-                    group2 TEXT,
-                    group3 TEXT,
-                    group_role TEXT,
-                    first_seen_utc TEXT,
-                    last_seen_utc TEXT,
-                    checkin_count INTEGER,
-                    groups_json TEXT,
-                    trusted INTEGER
-                )
-                """
-            )
-            # check existing
-            cur.execute("SELECT trusted FROM operator_checkins WHERE callsign=?", (cs,))
-            row = cur.fetchone()
             ts_str = last_seen.astimezone(datetime.timezone.utc).isoformat()
             groups_json = json.dumps([group_val]) if group_val else None
-            if row is None:
-                cur.execute(
-                    """
-                    INSERT INTO operator_checkins (
-                        callsign, name, state, grid, group1, group2, group3, group_role,
-                        first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted
-                    ) VALUES (?, '', '', '', ?, '', '', '', ?, ?, 0, ?, 0)
-                    """,
-                    (cs, group_val, ts_str, ts_str, groups_json),
-                )
-            else:
-                trusted = int(row[0] or 0)
-                if trusted == 0:
-                    cur.execute(
-                        """
-                        UPDATE operator_checkins
-                        SET last_seen_utc=?, group1=COALESCE(NULLIF(group1,''), ?), groups_json=COALESCE(groups_json, ?)
-                        WHERE callsign=?
-                        """,
-                        (ts_str, group_val, groups_json, cs),
-                    )
-            conn.commit()
-            conn.close()
+            # Insert new callsigns; refresh existing ones only while they are still untrusted
+            cur.execute(
+                SQL_UPSERT_UNTRUSTED,
+                (cs, group_val, ts_str, ts_str, groups_json),
+            )
+            self._db_commit()
         except Exception as e:
+            self._db_rollback()
             log.debug("JS8CallNetControl: failed to upsert untrusted operator %s: %s", callsign, e)
 
     def _increment_checkin_counter(self, callsign: str) -> None:
         cs = (callsign or "").strip().upper()
         if not cs:
             return
+        # UTC date, bound as a parameter rather than evaluated by SQLite per call
+        today = _utc_now_str()[:10]
         try:
-            root = Path(__file__).resolve().parents[2]
-            db_path = _nets_db_path()
-            conn = sqlite3.connect(db_path)
+            conn = self._db()
             cur = conn.cursor()
             cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS operator_checkins (
-                    callsign TEXT PRIMARY KEY,
-                    name TEXT,
-                    state TEXT,
-                    grid TEXT,
-                    group1 TEXT,
-                    group2 TEXT,
-                    group3 TEXT,
-                    group_role TEXT,
-                    first_seen_utc TEXT,
-                    last_seen_utc TEXT,
-                    last_net TEXT,
-                    last_role TEXT,
-                    checkin_count INTEGER DEFAULT 0,
-                    groups_json TEXT,
-                    trusted INTEGER DEFAULT 1
-                )
-                """
+                SQL_INCR_CHECKIN,
+                (cs, today, today),
             )
-            cur.execute("SELECT checkin_count FROM operator_checkins WHERE callsign=?", (cs,))
-            row = cur.fetchone()
-            if row:
-                count = int(row[0] or 0) + 1
-                cur.execute(
-                    "UPDATE operator_checkins SET checkin_count=?, last_seen_utc=strftime('%Y-%m-%d', 'now') WHERE callsign=?",
-                    (count, cs),
-                )
-            else:
-                cur.execute(
-                    """
-                    INSERT INTO operator_checkins (callsign, first_seen_utc, last_seen_utc, checkin_count, trusted)
-                    VALUES (?, strftime('%Y-%m-%d','now'), strftime('%Y-%m-%d','now'), 1, 0)
-                    """,
-                    (cs,),
-                )
-            conn.commit()
-            conn.close()
+            self._db_commit()
         except Exception as e:
+            self._db_rollback()
             log.error("JS8CallNetControl: failed to increment checkin count for %s: %s", cs, e)
-    def _maybe_capture_grid_report(self, line: str) -> None:
+    def _maybe_capture_grid_report(
+        self, line: str, parts: Optional[List[str]] = None, up: Optional[str] = None
+    ) -> None:
         """
         Capture GRID reports in DIRECTED.TXT lines (ignore GRID? queries).
         """
-        if "..." in line:
+        # Cheap rejects first: almost no DIRECTED line carries a GRID report
+        if up is None:
+            up = line.upper()
+        if "GRID" not in up or "GRID?" in up or "..." in line:
             return
-        parts = line.split("\t")
+        if parts is None:
+            parts = line.split("\t", 4)
         if len(parts) < 5:
             return
-        if "GRID?" in line.upper():
-            return
         msg = parts[4]
-        if "GRID" not in msg.upper():
-            return
-        try:
-            ts = datetime.datetime.strptime(parts[0][:19], "%Y-%m-%d %H:%M:%S").replace(tzinfo=datetime.timezone.utc)
-        except Exception:
-            ts = datetime.datetime.now(datetime.timezone.utc)
-        freq_hz = None
-        try:
-            freq_hz = float(parts[1]) * 1_000_000.0
-        except Exception:
-            freq_hz = None
         # Parse origin and tokens
         if ":" not in msg:
             return
-        origin, rest = msg.split(":", 1)
-        origin = origin.strip().upper()
-        tokens = rest.strip().replace(",", " ").split()
-        if not tokens:
-            return
+        origin, rest = msg.upper().split(":", 1)
+        origin = origin.strip()
+        tokens = rest.translate(_DELIM_TABLE).split()
         # Look for GRID token
         try:
-            idx = [t.upper() for t in tokens].index("GRID")
+            idx = tokens.index("GRID")
         except ValueError:
             return
         if idx + 1 >= len(tokens):
             return
-        grid = tokens[idx + 1].strip().upper()
+        grid = tokens[idx + 1].strip()
         if not grid or "?" in grid or not self._valid_grid(grid):
             return
+        try:
+            ts = _parse_line_ts(parts[0])
+        except Exception:
+            ts = datetime.datetime.now(datetime.timezone.utc)
+        freq_hz = None
+        try:
+            freq_hz = float(parts[1]) * 1_000_000.0
+        except Exception:
+            freq_hz = None
         # Choose longest grid compared to existing later
         grp = ""
         # explicit @GROUP if present
         for t in tokens:
             if t.startswith("@"):
-                grp = t.lstrip("@").upper()
+                grp = t.lstrip("@")
                 break
         groups = []
         if grp and self._is_allowed_group(grp):
@@ -1777,44 +2202,47 @@ class JS8CallNetControlTab(QWidget):
         self._upsert_operator_info(origin, grid, groups, ts)
 
     def _lookup_operating_group(self, freq_hz: Optional[float]) -> str:
-        try:
-            ops = self.settings.get("operating_groups", []) or []
-        except Exception:
-            return ""
         if not freq_hz:
             return ""
-        mhz = round(freq_hz / 1_000_000.0, 3)
-        for row in ops:
+        by_mhz = self._op_group_by_mhz
+        if by_mhz is None:
+            by_mhz = self._op_group_by_mhz = {}
             try:
-                ftxt = str(row.get("frequency", "")).strip()
-                if not ftxt:
-                    continue
-                if abs(float(ftxt) - mhz) < 0.0005:
-                    grp = str(row.get("group", "")).strip()
-                    if grp:
-                        return grp.upper()
+                ops = self.settings.get("operating_groups", []) or []
             except Exception:
-                continue
-        return ""
+                ops = []
+            for row in ops:
+                try:
+                    ftxt = str(row.get("frequency", "")).strip()
+                    grp = str(row.get("group", "")).strip()
+                    if ftxt and grp:
+                        # First row for a frequency wins, as with the old linear scan
+                        by_mhz.setdefault(round(float(ftxt), 3), grp.upper())
+                except Exception:
+                    continue
+        return by_mhz.get(round(freq_hz / 1_000_000.0, 3), "")
 
     def _is_allowed_group(self, grp: str) -> bool:
         g = (grp or "").strip().upper()
         if not g:
             return False
-        try:
-            prim = [x.strip().upper() for x in (self.settings.get("primary_js8_groups", []) or []) if x]
-        except Exception:
-            prim = []
-        try:
-            ops = [str(row.get("group", "")).strip().upper() for row in (self.settings.get("operating_groups", []) or []) if row]
-        except Exception:
-            ops = []
-        return g in prim or g in ops
+        allowed = self._allowed_groups_cache
+        if allowed is None:
+            try:
+                prim = frozenset(x.strip().upper() for x in (self.settings.get("primary_js8_groups", []) or []) if x)
+            except Exception:
+                prim = frozenset()
+            try:
+                ops = frozenset(
+                    str(row.get("group", "")).strip().upper() for row in (self.settings.get("operating_groups", []) or []) if row
+                )
+            except Exception:
+                ops = frozenset()
+            allowed = self._allowed_groups_cache = prim | ops
+        return g in allowed
 
     def _valid_grid(self, grid: str) -> bool:
-        import re
-        # Maidenhead: 4-char (LLDD) or 6-char (LLDDLL)
-        return bool(re.match(r"^[A-R]{2}[0-9]{2}([A-X]{2})?$", grid.upper()))
+        return bool(_GRID_RE.match(grid.upper()))
 
     def _upsert_operator_info(self, callsign: str, grid: str, groups: List[str], ts: datetime.datetime) -> None:
         cs = (callsign or "").strip().upper()
@@ -1822,30 +2250,10 @@ class JS8CallNetControlTab(QWidget):
             return
         ts_str = ts.astimezone(datetime.timezone.utc).isoformat()
         try:
-            db_path = _nets_db_path()
-            conn = sqlite3.connect(db_path)
+            conn = self._db()
             cur = conn.cursor()
             cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS operator_checkins (
-                    callsign TEXT PRIMARY KEY,
-                    name TEXT,
-                    state TEXT,
-                    grid TEXT,
-                    group1 TEXT,
-                    group2 TEXT,
-                    group3 TEXT,
-                    group_role TEXT,
-                    first_seen_utc TEXT,
-                    last_seen_utc TEXT,
-                    checkin_count INTEGER,
-                    groups_json TEXT,
-                    trusted INTEGER
-                )
-                """
-            )
-            cur.execute(
-                "SELECT grid, group1, group2, group3, groups_json, trusted FROM operator_checkins WHERE callsign=?",
+                SQL_SELECT_OPERATOR_GROUPS,
                 (cs,),
             )
             row = cur.fetchone()
@@ -1854,12 +2262,7 @@ class JS8CallNetControlTab(QWidget):
             groups_json = json.dumps(groups) if groups else None
             if row is None:
                 cur.execute(
-                    """
-                    INSERT INTO operator_checkins (
-                        callsign, name, state, grid, group1, group2, group3, group_role,
-                        first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted
-                    ) VALUES (?, '', '', ?, ?, ?, ?, '', ?, ?, 0, ?, 0)
-                    """,
+                    SQL_INSERT_OPERATOR_INFO,
                     (
                         cs,
                         grid,
@@ -1875,23 +2278,17 @@ class JS8CallNetControlTab(QWidget):
                 existing_grid, g1, g2, g3, gj, trusted = row
                 # Keep existing grid if already set; do not replace with new reports
                 final_grid = existing_grid.strip().upper() if existing_grid else grid
-                # merge groups into slots then json
-                slots = [g1 or "", g2 or "", g3 or ""]
-                slot_set = {s.strip().upper() for s in slots if s}
-                merged = slot_set.copy()
-                merged.update(groups)
-                # fill slots first
-                slots_filled = []
-                for s in slots:
-                    val = s.strip().upper()
+                # merge groups into slots then json: existing slots first, then new groups,
+                # in order and without duplicates; anything past three slots goes to json
+                ordered: Dict[str, None] = {}
+                for slot in (g1, g2, g3):
+                    val = (slot or "").strip().upper()
                     if val:
-                        slots_filled.append(val)
+                        ordered[val] = None
                 for g in groups:
-                    if len(slots_filled) < 3 and g not in slots_filled:
-                        slots_filled.append(g)
-                while len(slots_filled) < 3:
-                    slots_filled.append("")
-                extra = merged - set(slots_filled) if merged else set()
+                    ordered.setdefault(g, None)
+                keys = list(ordered)
+                slots_filled = (keys[:3] + ["", "", ""])[:3]
                 extra_json = []
                 if gj:
                     try:
@@ -1900,21 +2297,13 @@ class JS8CallNetControlTab(QWidget):
                             extra_json.extend([str(x).upper() for x in prev])
                     except Exception:
                         pass
-                for g in extra:
-                    if g and g not in extra_json:
+                seen = set(extra_json)
+                for g in keys[3:]:
+                    if g not in seen:
+                        seen.add(g)
                         extra_json.append(g)
                 cur.execute(
-                    """
-                    UPDATE operator_checkins
-                    SET
-                        grid=?,
-                        group1=?,
-                        group2=?,
-                        group3=?,
-                        groups_json=?,
-                        last_seen_utc=?
-                    WHERE callsign=?
-                    """,
+                    SQL_UPDATE_OPERATOR_INFO,
                     (
                         final_grid,
                         slots_filled[0],
@@ -1925,9 +2314,10 @@ class JS8CallNetControlTab(QWidget):
                         cs,
                     ),
                 )
-            conn.commit()
-            conn.close()
+            self._db_commit()
+            self._note_grid_known(cs)
         except Exception as e:
+            self._db_rollback()
             log.debug("JS8CallNetControl: failed to upsert operator info %s: %s", callsign, e)
     def _queue_auto_query(self, call: str, msg_id: str, snr: float | None = None, speed: int | None = None) -> None:
         """
@@ -1949,7 +2339,7 @@ class JS8CallNetControlTab(QWidget):
             speed_val = int(speed) if speed is not None else None
         except Exception:
             speed_val = None
-        self._pending_queries.append((snr_val, speed_val, call, msg_id))
+        self._push_pending_query(snr_val, speed_val, call, msg_id)
         log.debug(
             "JS8CallNetControl: queued auto-query call=%s id=%s (snr=%s speed=%s) pending=%d",
             call,
@@ -1960,6 +2350,12 @@ class JS8CallNetControlTab(QWidget):
         )
         self._maybe_process_next_query()
 
+    def _push_pending_query(self, snr_val: Optional[float], speed_val: Optional[int], call: str, msg_id: str) -> None:
+        heapq.heappush(
+            self._pending_queries,
+            (999 if snr_val is None else snr_val, next(self._pending_query_seq), snr_val, speed_val, call, msg_id),
+        )
+
     def _maybe_process_next_query(self) -> None:
         if self._waiting_for_completion:
             if self._current_query_sent_ts and (time.time() - self._current_query_sent_ts) > 15:
@@ -1976,7 +2372,7 @@ class JS8CallNetControlTab(QWidget):
             return
         if self._auto_query_paused_by_net:
             # Persist pending to backlog so we can retry later
-              for snr_val, speed_val, call, msg_id in list(self._pending_queries):
+              for _key, _seq, snr_val, speed_val, call, msg_id in list(self._pending_queries):
                   self._backlog_upsert(call, msg_id, "MSG", status="PENDING")
               self._pending_queries.clear()
               return
@@ -1985,8 +2381,7 @@ class JS8CallNetControlTab(QWidget):
             log.debug("JS8CallNetControl: RX idle gap not met; deferring auto-query")
             return
         # Prefer weakest SNR first (more negative first), unknowns last
-        self._pending_queries.sort(key=lambda t: (999 if t[0] is None else t[0]))
-        snr_val, speed_val, call, msg_id = self._pending_queries.pop(0)
+        _key, _seq, snr_val, speed_val, call, msg_id = heapq.heappop(self._pending_queries)
         log.debug(
             "JS8CallNetControl: processing auto-query call=%s id=%s (snr=%s speed=%s) remaining=%d",
             call,
@@ -2020,6 +2415,7 @@ class JS8CallNetControlTab(QWidget):
                 base_timeout = 180
             expiry = time.time() + base_timeout
             self._awaiting_msg_responses[(call, msg_id)] = expiry
+            self._awaiting_msg_by_call.setdefault(call, set()).add(msg_id)
             self._backlog_upsert(call, msg_id, "MSG", status="PENDING")
             log.info("JS8CallNetControl: auto-queried MSG ID %s from %s via TX.SEND_MESSAGE", msg_id, call)
         else:
@@ -2035,46 +2431,70 @@ class JS8CallNetControlTab(QWidget):
         client = self._get_js8_client()
         if client is None or not hasattr(js8net, "rx_queue"):
             return
-        try:
-            while True:
-                msg = js8net.rx_queue.get_nowait()
+        # Work out once per drain which handlers are armed; skip the rest per message
+        need_query = self.auto_query_msg_id and not self._auto_query_paused_by_net
+        need_grid_query = self.auto_query_grids and not self._auto_query_paused_by_net
+        need_forms = bool(self._net_in_progress and self._expected_form)
+        # Take everything queued so far under one lock acquisition instead of paying
+        # get_nowait()'s locking/notify per message (rx_queue is an unbounded Queue)
+        rx_queue = js8net.rx_queue
+        with rx_queue.mutex:
+            drained = rx_queue.queue
+            rx_queue.queue = collections.deque()
+        if need_grid_query and drained:
+            # Resolve grid-known/missing for every sender in this drain with one query
+            senders = set()
+            for msg in drained:
+                p = msg.get("params", {}) if isinstance(msg, dict) else {}
+                frm = str(p.get("FROM") or "").strip().upper()
+                if frm:
+                    senders.add(self._base_callsign(frm))
+            self._prime_missing_grid(senders)
+        # One transaction for all check-in/grid writes in this drain
+        with self._db_batch():
+            for msg in drained:
                 now_ts = time.time()
                 self._last_rx_ts = now_ts
                 self._grid_last_rx_ts = now_ts
                 try:
                     p = msg.get("params", {}) if isinstance(msg, dict) else {}
                     txt = str(p.get("TEXT") or "").upper()
-                    cmd_txt = str(p.get("CMD") or "").upper()
-                    extra_txt = str(p.get("EXTRA") or "").upper()
-                    combined = " ".join([txt, cmd_txt, extra_txt]).strip()
                     frm = (p.get("FROM") or "").strip().upper()
                     base_frm = self._base_callsign(frm) if frm else ""
+                    awaiting = bool(base_frm) and (
+                        base_frm in self._awaiting_msg_by_call or base_frm in self._awaiting_grid_responses
+                    )
+                    combined = ""
+                    if need_query or need_forms or awaiting:
+                        cmd_txt = str(p.get("CMD") or "").upper()
+                        extra_txt = str(p.get("EXTRA") or "").upper()
+                        combined = " ".join([txt, cmd_txt, extra_txt]).strip()
+                    snr_val = None
+                    if need_query or need_grid_query or self._net_in_progress:
+                        try:
+                            snr_val = float(p.get("SNR")) if p.get("SNR") not in (None, "") else None
+                        except Exception:
+                            snr_val = None
                     if base_frm:
                         self._call_last_rx_ts[base_frm] = now_ts
                         # If awaiting MSG response for this call, mark retrieved on any MSG token
-                        for (c, mid), exp in list(self._awaiting_msg_responses.items()):
-                            if c == base_frm and "MSG" in combined:
-                                self._mark_backlog_retrieved(c, mid, "MSG")
-                                self._awaiting_msg_responses.pop((c, mid), None)
+                        if "MSG" in combined and base_frm in self._awaiting_msg_by_call:
+                            for mid in list(self._awaiting_msg_by_call[base_frm]):
+                                self._mark_backlog_retrieved(base_frm, mid, "MSG")
+                                self._drop_awaiting_msg(base_frm, mid)
                         # If awaiting GRID response for this call and GRID present, mark retrieved
                         if base_frm in self._awaiting_grid_responses and "GRID" in combined:
                             self._mark_backlog_retrieved(base_frm, "", "GRID")
                             self._awaiting_grid_responses.pop(base_frm, None)
                         if self._net_in_progress:
                             # Extract metrics from API payload when available
-                            try:
-                                snr_val = float(p.get("SNR")) if p.get("SNR") not in (None, "") else None
-                            except Exception:
-                                snr_val = None
                             speed_val = p.get("SPEED")
                             mode_name = ""
                             sval: int | None = None
                             if speed_val is not None:
                                 try:
                                     sval = int(speed_val)
-                                    mode_name = {0: "Normal", 1: "Fast", 2: "Turbo", 4: "Slow"}.get(
-                                        sval, str(speed_val)
-                                    )
+                                    mode_name = _MODE_NAMES.get(sval, str(speed_val))
                                 except Exception:
                                     mode_name = str(speed_val)
                                 if sval is not None:
@@ -2097,23 +2517,17 @@ class JS8CallNetControlTab(QWidget):
                                 offset=offset_val,
                                 grid=(p.get("GRID") or "").strip().upper(),
                             )
-                    snr_val = None
-                    try:
-                        snr_val = float(p.get("SNR")) if p.get("SNR") not in (None, "") else None
-                    except Exception:
-                        snr_val = None
-                    if self.auto_query_msg_id and not self._auto_query_paused_by_net:
+                    if need_query:
                         if self._net_lockout_active():
                             log.debug("JS8CallNetControl: skipping auto-query (net lockout active)")
                         elif "YES MSG" in combined:
-                            ids = re.findall(r"\b(\d+)\b", combined)
+                            ids = _ID_RE.findall(combined)
                             for mid in ids:
                                 if frm:
                                     log.info("JS8CallNetControl: detected YES MSG %s from %s (snr=%s)", mid, frm, snr_val)
                                     self._queue_auto_query(frm, mid, snr=snr_val, speed=p.get("SPEED"))
                     # Passive grid capture
                     grid_val = (p.get("GRID") or "").strip()
-                    base_frm = self._base_callsign(frm) if frm else ""
                     if grid_val and base_frm:
                         self._update_operator_grid(base_frm, grid_val, self._active_group_name())
                     else:
@@ -2122,8 +2536,8 @@ class JS8CallNetControlTab(QWidget):
                                 self._update_operator_grid(base_frm or frm, token, self._active_group_name())
                                 break
                     # Spotter form response handling
-                    if self._net_in_progress and self._expected_form:
-                        forms_found = re.findall(r"F![0-9]{3}", combined)
+                    if need_forms:
+                        forms_found = _FORM_RE.findall(combined)
                         for form in forms_found:
                             if form.upper() not in CHECKIN_FORMS:
                                 continue
@@ -2135,26 +2549,25 @@ class JS8CallNetControlTab(QWidget):
                                     status_mismatch=mismatch,
                                 )
                     # Auto grid query when allowed
-                    if self.auto_query_grids and not self._auto_query_paused_by_net and not self._net_lockout_active():
+                    if need_grid_query and not self._net_lockout_active():
                         target_cs = base_frm or frm
                         if target_cs and self._operator_missing_grid(target_cs):
                             self._maybe_queue_grid_query(target_cs, snr_val, msg_params=p, text=txt)
                 except Exception:
                     continue
-        except queue.Empty:
-            pass
         self._maybe_process_next_query()
         self._maybe_process_next_grid()
 
-    def _line_has_checkin_form(self, line: str) -> bool:
+    def _line_has_checkin_form(self, line: str, up: Optional[str] = None) -> bool:
         """
         Returns True if the line contains a JS8Spotter check-in form (F!103 or F!104).
         """
-        up = line.upper()
+        if up is None:
+            up = line.upper()
         return any(form in up for form in CHECKIN_FORMS)
 
-    def _line_has_announce_form(self, line: str) -> bool:
-        return ANNOUNCE_FORM in line.upper()
+    def _line_has_announce_form(self, line: str, up: Optional[str] = None) -> bool:
+        return ANNOUNCE_FORM in (up if up is not None else line.upper())
 
     def _maybe_notify_announcement(self, callsign: str, line: str) -> None:
         """
@@ -2176,6 +2589,12 @@ class JS8CallNetControlTab(QWidget):
             return
         self._recent_announcements[call] = now
         msg_text = line
+        # Don't hold a drain's open write transaction across the modal popup
+        if self._db_conn is not None and self._db_conn.in_transaction:
+            try:
+                self._db_conn.commit()
+            except Exception as e:
+                log.debug("JS8CallNetControl: failed to commit before announcement popup: %s", e)
         try:
             QMessageBox.information(
                 self,
@@ -2187,54 +2606,136 @@ class JS8CallNetControlTab(QWidget):
 
     # ---------------- Auto-query backlog ---------------- #
 
-    def _backlog_db_path(self) -> Path:
-        return _nets_db_path()
+    def _db_writer_loop(self) -> None:
+        """
+        Background writer: apply queued writes in batches of up to 100, one commit
+        per batch. Runs on its own connection for the life of the process.
+        A queued item is (sql, params), or (fn, args) for writes that must read the
+        current row first; fn is called as fn(conn, *args). An optional third
+        element on_done(ok) is called on this thread once the write commits or
+        is dropped.
+
+        Writes that fail with "database is locked" (the GUI connection holding a
+        write transaction past the busy timeout) are retried with a backoff, up to
+        _DB_WRITE_ATTEMPTS times, before being dropped with an error.
+        """
+        conn = None
+        while True:
+            batch = [self._wq.get()]
+            while len(batch) < 100:
+                try:
+                    batch.append(self._wq.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                pending = batch
+                attempt = 0
+                while pending:
+                    attempt += 1
+                    conn, pending = self._apply_db_writes(conn, pending, attempt)
+                    if pending:
+                        log.warning(
+                            "JS8CallNetControl: %d queued DB write(s) hit a locked database; retry %d/%d",
+                            len(pending),
+                            attempt,
+                            _DB_WRITE_ATTEMPTS - 1,
+                        )
+                        time.sleep(0.5 * attempt)
+            finally:
+                for _ in batch:
+                    self._wq.task_done()
 
-    def _backlog_upsert(self, callsign: str, msg_id: str, kind: str, status: str = "PENDING") -> None:
+    def _apply_db_writes(self, conn, items: list, attempt: int):
+        """
+        Writer-thread helper: run items in one transaction and commit.
+        Returns (conn, items to retry); only lock errors are retried, and only
+        while attempts remain.
+        """
+        can_retry = attempt < _DB_WRITE_ATTEMPTS
+        retry = []
+        applied = []
+        dropped = []
         try:
-            conn = sqlite3.connect(self._backlog_db_path())
-            cur = conn.cursor()
-            now_ts = time.time()
-            cur.execute(
-                """
-                DELETE FROM autoquery_backlog WHERE callsign=? AND COALESCE(msg_id,'')=COALESCE(?, '') AND kind=?
-                """,
-                (callsign, msg_id or "", kind),
-            )
-            cur.execute(
-                """
-                INSERT INTO autoquery_backlog (callsign, msg_id, kind, status, attempts, last_attempt_ts, created_ts)
-                VALUES (?, ?, ?, ?, 0, ?, ?)
-                """,
-                (callsign, msg_id, kind, status, now_ts, now_ts),
-            )
+            if conn is None:
+                conn = sqlite3.connect(self._db_path, timeout=10, cached_statements=256)
+                conn.execute("PRAGMA synchronous=NORMAL")
+            for item in items:
+                sql, params = item[0], item[1]
+                try:
+                    if callable(sql):
+                        sql(conn, *params)
+                    else:
+                        conn.execute(sql, params)
+                    applied.append(item)
+                except Exception as e:
+                    if can_retry and _is_lock_error(e):
+                        retry.append(item)
+                    else:
+                        log.error("JS8CallNetControl: queued DB write dropped: %s", e)
+                        dropped.append(item)
             conn.commit()
-            conn.close()
         except Exception as e:
-            log.debug("JS8 autoquery backlog upsert failed: %s", e)
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            # Nothing in this transaction landed
+            if can_retry and _is_lock_error(e):
+                return conn, list(items)
+            log.error("JS8CallNetControl: DB writer dropped %d queued write(s): %s", len(items), e)
+            self._report_db_writes(items, False)
+            return conn, []
+        self._report_db_writes(applied, True)
+        self._report_db_writes(dropped, False)
+        return conn, retry
+
+    @staticmethod
+    def _report_db_writes(items: list, ok: bool) -> None:
+        for item in items:
+            if len(item) > 2:
+                try:
+                    item[2](ok)
+                except Exception as e:
+                    log.debug("JS8CallNetControl: DB write callback failed: %s", e)
+
+    def _flush_db_writes(self, timeout: float = _DB_FLUSH_TIMEOUT_SECS) -> bool:
+        """
+        Wait until every queued write has been committed (used at shutdown).
+        Any open GUI write transaction is committed first so the writer is not
+        left waiting on its lock. Returns False if the writer did not drain in time.
+        """
+        if self._db_conn is not None and self._db_conn.in_transaction:
+            try:
+                self._db_conn.commit()
+            except Exception as e:
+                log.debug("JS8CallNetControl: failed to commit before flushing writes: %s", e)
+        deadline = time.monotonic() + timeout
+        with self._wq.all_tasks_done:
+            while self._wq.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log.error(
+                        "JS8CallNetControl: %d queued DB write(s) still pending after %.0fs",
+                        self._wq.unfinished_tasks,
+                        timeout,
+                    )
+                    return False
+                self._wq.all_tasks_done.wait(remaining)
+        return True
+
+    def _backlog_upsert(self, callsign: str, msg_id: str, kind: str, status: str = "PENDING") -> None:
+        now_ts = time.time()
+        self._wq.put((SQL_BACKLOG_UPSERT, (callsign, msg_id, kind, status, now_ts, now_ts)))
 
     def _backlog_mark(self, callsign: str, msg_id: str, kind: str, status: str) -> None:
-        try:
-            conn = sqlite3.connect(self._backlog_db_path())
-            cur = conn.cursor()
-            cur.execute(
-                """
-                UPDATE autoquery_backlog
-                SET status=?, last_attempt_ts=?
-                WHERE callsign=? AND COALESCE(msg_id,'')=COALESCE(?, '') AND kind=?
-                """,
-                (status, time.time(), callsign, msg_id or "", kind),
-            )
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            log.debug("JS8 autoquery backlog mark failed: %s", e)
+        self._wq.put((SQL_BACKLOG_MARK, (status, time.time(), callsign, msg_id or "", kind)))
 
     def _backlog_fetch_pending(self, callsigns: List[str]) -> List[tuple[str, str, str]]:
         if not callsigns:
             return []
         try:
-            conn = sqlite3.connect(self._backlog_db_path())
+            conn = self._db()
             cur = conn.cursor()
             qs = ",".join("?" for _ in callsigns)
             cur.execute(
@@ -2246,28 +2747,22 @@ class JS8CallNetControlTab(QWidget):
                 [c.upper() for c in callsigns],
             )
             rows = cur.fetchall()
-            conn.close()
             return [(r[0] or "", r[1] or "", r[2] or "MSG") for r in rows]
         except Exception as e:
             log.debug("JS8 autoquery backlog fetch failed: %s", e)
             return []
 
+    def _backlog_pending_by_call(self, callsigns) -> Dict[str, List[tuple[str, str, str]]]:
+        """
+        Fetch pending backlog rows for many callsigns at once, grouped by callsign.
+        """
+        grouped: Dict[str, List[tuple[str, str, str]]] = {}
+        for row in self._backlog_fetch_pending(list(callsigns)):
+            grouped.setdefault(row[0].upper(), []).append(row)
+        return grouped
+
     def _backlog_touch_attempt(self, callsign: str, msg_id: str, kind: str) -> None:
-        try:
-            conn = sqlite3.connect(self._backlog_db_path())
-            cur = conn.cursor()
-            cur.execute(
-                """
-                UPDATE autoquery_backlog
-                SET attempts=attempts+1, last_attempt_ts=?
-                WHERE callsign=? AND COALESCE(msg_id,'')=COALESCE(?, '') AND kind=?
-                """,
-                (time.time(), callsign, msg_id or "", kind),
-            )
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            log.debug("JS8 autoquery backlog touch failed: %s", e)
+        self._wq.put((SQL_BACKLOG_TOUCH, (time.time(), callsign, msg_id or "", kind)))
 
     def _mark_backlog_retrieved(self, callsign: str, msg_id: str, kind: str) -> None:
         self._backlog_mark(callsign, msg_id, kind, "RETRIEVED")
@@ -2275,25 +2770,35 @@ class JS8CallNetControlTab(QWidget):
     def _mark_backlog_failed(self, callsign: str, msg_id: str, kind: str) -> None:
         self._backlog_mark(callsign, msg_id, kind, "FAILED")
 
+    def _drop_awaiting_msg(self, call: str, msg_id: str) -> None:
+        self._awaiting_msg_responses.pop((call, msg_id), None)
+        mids = self._awaiting_msg_by_call.get(call)
+        if mids is not None:
+            mids.discard(msg_id)
+            if not mids:
+                self._awaiting_msg_by_call.pop(call, None)
+
     def _expire_pending_responses(self) -> None:
         now = time.time()
         for key, exp in list(self._awaiting_msg_responses.items()):
             if now > exp:
                 call, mid = key
                 self._mark_backlog_failed(call, mid, "MSG")
-                self._awaiting_msg_responses.pop(key, None)
+                self._drop_awaiting_msg(call, mid)
         for call, exp in list(self._awaiting_grid_responses.items()):
             if now > exp:
                 self._mark_backlog_failed(call, "", "GRID")
                 self._awaiting_grid_responses.pop(call, None)
 
-    def _process_message_completion(self, line: str) -> None:
+    def _process_message_completion(self, line: str, complete: Optional[bool] = None) -> None:
         """
         Detect end-of-message markers before issuing next queued query.
         """
         if not self._waiting_for_completion:
             return
-        if not self._is_message_complete_line(line):
+        if complete is None:
+            complete = _is_message_complete_line(line)
+        if not complete:
             return
         self._waiting_for_completion = False
         call = self._current_query[0] if self._current_query else None
@@ -2323,99 +2828,118 @@ class JS8CallNetControlTab(QWidget):
         cs = self._base_callsign(callsign)
         if not cs:
             return False
+        if cs in self._grid_known or cs in self._grid_pending:
+            return False
+        if cs in self._grid_missing:
+            return True
         try:
-            db_path = _nets_db_path()
-            if not db_path.exists():
-                return True
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute("SELECT grid FROM operator_checkins WHERE callsign=?", (cs,))
+            cur = self._db().cursor()
+            cur.execute(SQL_SELECT_OPERATOR_GRID, (cs,))
             row = cur.fetchone()
-            conn.close()
-            if row is None:
-                return True
-            grid = row[0] or ""
-            return grid.strip() == ""
         except Exception:
             return True
+        if row is None or not (row[0] or "").strip():
+            self._grid_missing.add(cs)
+            return True
+        self._grid_known.add(cs)
+        return False
+
+    def _prime_missing_grid(self, callsigns) -> None:
+        """
+        Fill the _operator_missing_grid memo for all uncached callsigns in one IN query.
+        """
+        todo = [
+            c
+            for c in callsigns
+            if c and c not in self._grid_known and c not in self._grid_missing and c not in self._grid_pending
+        ]
+        if not todo:
+            return
+        try:
+            cur = self._db().cursor()
+            qs = ",".join("?" for _ in todo)
+            cur.execute(f"SELECT callsign, grid FROM operator_checkins WHERE callsign IN ({qs})", todo)
+            rows = cur.fetchall()
+        except Exception as e:
+            log.debug("JS8CallNetControl: failed to prime grid cache: %s", e)
+            return
+        has_grid = {(r[0] or "").upper() for r in rows if (r[1] or "").strip()}
+        for c in todo:
+            if c in has_grid:
+                self._grid_known.add(c)
+            else:
+                self._grid_missing.add(c)
+
+    def _note_grid_known(self, callsign: str) -> None:
+        cs = self._base_callsign(callsign)
+        self._grid_known.add(cs)
+        self._grid_missing.discard(cs)
 
     def _update_operator_grid(self, callsign: str, grid: str, group_name: str = "") -> None:
         cs = self._base_callsign(callsign)
         grid = (grid or "").strip().upper()
         if not cs or not grid:
             return
+        # Applied by the background writer. Until it commits the call is held in
+        # _grid_pending (no GRID? for it); the memo only records the grid as known
+        # once grid_write_done reports the commit.
+        now_iso = _utc_now_str()
+        group_name = (group_name or "").strip()
+        done = functools.partial(self.grid_write_done.emit, cs)
+        self._grid_pending.add(cs)
+        self._grid_missing.discard(cs)
+        if not group_name:
+            # Grid-only update: one statement, no read
+            self._wq.put((SQL_UPSERT_OPERATOR_GRID, (cs, grid, now_iso, now_iso), done))
+        else:
+            self._wq.put((self._write_operator_grid_groups, (cs, grid, group_name, now_iso), done))
+
+    def _on_grid_write_done(self, cs: str, ok: bool) -> None:
+        self._grid_pending.discard(cs)
+        if ok:
+            self._note_grid_known(cs)
+        else:
+            # Not stored: let the next lookup hit the DB (and GRID? again if still missing)
+            self._grid_known.discard(cs)
+
+    @classmethod
+    def _write_operator_grid_groups(
+        cls, conn: sqlite3.Connection, cs: str, grid: str, group_name: str, now_iso: str
+    ) -> None:
+        """
+        Writer-thread half of _update_operator_grid: group slots/groups_json need the
+        stored values to merge into, so the row is read on the writer's connection.
+        """
+        row = conn.execute(SQL_SELECT_OPERATOR_GROUPS, (cs,)).fetchone()
+        g1, g2, g3, groups_json = cls._merge_operator_groups(row, group_name)
+        conn.execute(
+            SQL_UPSERT_OPERATOR_GRID_GROUPS,
+            (cs, grid, g1, g2, g3, now_iso, now_iso, groups_json),
+        )
+
+    @staticmethod
+    def _merge_operator_groups(row, group_name: str):
+        """
+        Fold group_name into the legacy group1..3 slots (first empty slot) and groups_json.
+        `row` is a SQL_SELECT_OPERATOR_GROUPS result or None for a new operator.
+        """
+        if row is None:
+            return group_name, None, None, json.dumps([group_name])
+        _, g1, g2, g3, groups_json, _ = row
+        g_list = [g1 or "", g2 or "", g3 or ""]
+        if group_name not in g_list:
+            for idx, val in enumerate(g_list):
+                if not val:
+                    g_list[idx] = group_name
+                    break
         try:
-            db_path = _nets_db_path()
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS operator_checkins (
-                    callsign TEXT PRIMARY KEY,
-                    name TEXT,
-                    state TEXT,
-                    grid TEXT,
-                    group1 TEXT,
-                    group2 TEXT,
-                    group3 TEXT,
-                    group_role TEXT,
-                    first_seen_utc TEXT,
-                    last_seen_utc TEXT,
-                    last_net TEXT,
-                    last_role TEXT,
-                    checkin_count INTEGER DEFAULT 0,
-                    groups_json TEXT,
-                    trusted INTEGER DEFAULT 1
-                )
-                """
-            )
-            cur.execute("SELECT grid, group1, group2, group3, groups_json, trusted FROM operator_checkins WHERE callsign=?", (cs,))
-            row = cur.fetchone()
-            now_iso = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-            if row is None:
-                groups = [g for g in [group_name.strip()] if g]
-                groups_json = json.dumps(groups) if groups else None
-                cur.execute(
-                    """
-                    INSERT OR REPLACE INTO operator_checkins
-                    (callsign, grid, group1, group2, group3, group_role, first_seen_utc, last_seen_utc, checkin_count, groups_json, trusted)
-                    VALUES (?, ?, ?, ?, ?, NULL, ?, ?, 0, ?, 1)
-                    """,
-                    (cs, grid, group_name or None, None, None, now_iso, now_iso, groups_json),
-                )
-            else:
-                old_grid, g1, g2, g3, groups_json, trusted = row
-                new_grid = old_grid or grid
-                g_list = [g1 or "", g2 or "", g3 or ""]
-                if group_name and group_name not in g_list:
-                    for idx, val in enumerate(g_list):
-                        if not val:
-                            g_list[idx] = group_name
-                            break
-                try:
-                    current_groups = json.loads(groups_json) if groups_json else []
-                    if group_name and group_name not in current_groups:
-                        current_groups.append(group_name)
-                    groups_json_out = json.dumps(current_groups) if current_groups else None
-                except Exception:
-                    groups_json_out = groups_json
-                cur.execute(
-                    """
-                    UPDATE operator_checkins
-                    SET grid=?, group1=?, group2=?, group3=?, last_seen_utc=?, groups_json=?, trusted=COALESCE(trusted, ?)
-                    WHERE callsign=?
-                    """,
-                    (new_grid, g_list[0] or None, g_list[1] or None, g_list[2] or None, now_iso, groups_json_out, trusted if trusted is not None else 1, cs),
-                )
-            conn.commit()
-        except Exception as e:
-            log.debug("JS8CallNetControl: failed to update operator grid for %s: %s", callsign, e)
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+            current_groups = json.loads(groups_json) if groups_json else []
+            if group_name not in current_groups:
+                current_groups.append(group_name)
+            groups_json_out = json.dumps(current_groups) if current_groups else None
+        except Exception:
+            groups_json_out = groups_json
+        return g_list[0] or None, g_list[1] or None, g_list[2] or None, groups_json_out
 
     def _active_group_name(self) -> str:
         entry = self._active_schedule()
@@ -2440,11 +2964,8 @@ class JS8CallNetControlTab(QWidget):
             return
         sched_group = (active.get("group_name") or "").strip().upper()
         configured_groups = [g.strip().upper() for g in (self.settings.get("primary_js8_groups", []) or []) if g]
-        incoming_group = ""
-        for tok in text.split():
-            if tok.startswith("@") and len(tok) > 1:
-                incoming_group = tok[1:].upper()
-                break
+        m = _GROUP_TOKEN_RE.search(text)
+        incoming_group = m.group(1).upper() if m else ""
         if not configured_groups:
             group_ok = True
         else:
@@ -2452,10 +2973,20 @@ class JS8CallNetControlTab(QWidget):
         if not group_ok:
             return
         # Enqueue if not already queued
-        for _, queued_call in self._pending_grid_queries:
-            if queued_call == call:
-                return
-        self._pending_grid_queries.append((snr, call))
+        if call in self._pending_grid_calls:
+            return
+        self._push_pending_grid(snr, call)
+
+    def _push_pending_grid(self, snr_val: Optional[float], call: str) -> None:
+        """
+        Queue a GRID? for `call`; callers check _pending_grid_calls first so the heap
+        holds at most one entry per call and the set stays an exact index of it.
+        """
+        heapq.heappush(
+            self._pending_grid_queries,
+            (999 if snr_val is None else snr_val, next(self._pending_query_seq), snr_val, call),
+        )
+        self._pending_grid_calls.add(call)
 
     def _maybe_process_next_grid(self) -> None:
         if not self._pending_grid_queries:
@@ -2470,22 +3001,23 @@ class JS8CallNetControlTab(QWidget):
         if time.time() - self._last_tx_ts < 5.0:
             return
         now_ts = time.time()
-        # Weakest SNR first
-        self._pending_grid_queries.sort(key=lambda t: (999 if t[0] is None else t[0]))
-        # Respect per-callsign quiet window
-        processed = 0
-        max_attempts = len(self._pending_grid_queries)
-        while self._pending_grid_queries and processed < max_attempts:
-            snr_val, call = self._pending_grid_queries.pop(0)
-            last_rx = self._call_last_rx_ts.get(self._base_callsign(call), 0.0)
+        # Weakest SNR first, respecting the per-callsign quiet window
+        skipped = []
+        call = None
+        while self._pending_grid_queries:
+            entry = heapq.heappop(self._pending_grid_queries)
+            last_rx = self._call_last_rx_ts.get(self._base_callsign(entry[3]), 0.0)
             if last_rx and (now_ts - last_rx) < AUTO_GRID_QUIET_SECS:
-                # Too recent; push to back and try later
-                self._pending_grid_queries.append((snr_val, call))
-                processed += 1
+                # Too recent; keep it queued and try later
+                skipped.append(entry)
                 continue
+            call = entry[3]
             break
-        else:
+        for entry in skipped:
+            heapq.heappush(self._pending_grid_queries, entry)
+        if call is None:
             return
+        self._pending_grid_calls.discard(call)
         mycall = self._my_callsign() or ""
         query_text = f"{mycall}: {call} GRID?".strip()
         log.info("JS8CallNetControl: attempting auto grid query to %s text=\"%s\"", call, query_text)
@@ -2498,20 +3030,10 @@ class JS8CallNetControlTab(QWidget):
             log.error("JS8CallNetControl: failed GRID? to %s", call)
             self._backlog_upsert(call, "", "GRID", status="PENDING")
 
-    def _is_message_complete_line(self, line: str) -> bool:
-        """
-        Heuristic: treat lines containing the JS8Call end-of-message marker
-        (diamond U+2662) as completion markers.
-        """
-        txt = line.strip()
-        if not txt:
-            return False
-        return "\u2662" in txt
-
     # ---------------- Schedule helpers ---------------- #
 
     def _parse_hhmm_to_minutes(self, hhmm: str) -> Optional[int]:
-        txt = (hhmm or "").strip()
+        txt = str(hhmm or "").strip()
         if not txt:
             return None
         try:
@@ -2527,25 +3049,27 @@ class JS8CallNetControlTab(QWidget):
     def _load_net_rows(self) -> List[Dict]:
         data = []
         try:
-            db_path = _nets_db_path()
-            if db_path.exists():
-                conn = sqlite3.connect(db_path)
-                cur = conn.cursor()
-                cur.execute(
-                    "SELECT day_utc, frequency, start_utc, end_utc, early_checkin, group_name FROM net_schedule_tab"
-                )
-                for row in cur.fetchall():
-                    data.append(
-                        {
-                            "day_utc": row[0] or "",
-                            "frequency": row[1] or "",
-                            "start_utc": row[2] or "",
-                            "end_utc": row[3] or "",
-                            "early_checkin": int(row[4] or 0),
-                            "group_name": row[5] or "",
-                        }
-                    )
-                conn.close()
+            db_path = self._db_path
+            stamp = _db_stamp(db_path)
+            if stamp is not None and self._net_rows_cache and self._net_rows_cache[0] == stamp:
+                data = self._net_rows_cache[1]
+            elif stamp is not None:
+                parse = self._parse_hhmm_to_minutes
+                data = [
+                    {
+                        "day_utc": row[0] or "",
+                        "day_mask": _day_mask(row[0]),
+                        "frequency": row[1] or "",
+                        "start_utc": row[2] or "",
+                        "end_utc": row[3] or "",
+                        "start_m": parse(row[2]),
+                        "end_m": parse(row[3]),
+                        "early_checkin": int(row[4] or 0),
+                        "group_name": row[5] or "",
+                    }
+                    for row in self._db().execute(SQL_SELECT_NET_SCHEDULE)
+                ]
+                self._net_rows_cache = (stamp, data)
         except Exception:
             pass
         if not data:
@@ -2555,9 +3079,12 @@ class JS8CallNetControlTab(QWidget):
                     data = [
                         {
                             "day_utc": r.get("day_utc", ""),
+                            "day_mask": _day_mask(r.get("day_utc", "")),
                             "frequency": r.get("frequency", ""),
                             "start_utc": r.get("start_utc", ""),
                             "end_utc": r.get("end_utc", ""),
+                            "start_m": self._parse_hhmm_to_minutes(r.get("start_utc", "")),
+                            "end_m": self._parse_hhmm_to_minutes(r.get("end_utc", "")),
                             "early_checkin": int(r.get("early_checkin", 0) or 0),
                             "group_name": r.get("group_name", ""),
                         }
@@ -2571,22 +3098,26 @@ class JS8CallNetControlTab(QWidget):
     def _load_daily_rows(self) -> List[Dict]:
         data = []
         try:
-            db_path = get_config_dir() / "config" / "freqinout.db"
-            if db_path.exists():
-                conn = sqlite3.connect(db_path)
-                cur = conn.cursor()
-                cur.execute("SELECT day_utc, frequency, start_utc, end_utc, group_name FROM daily_schedule_tab")
-                for row in cur.fetchall():
-                    data.append(
-                        {
-                            "day_utc": row[0] or "ALL",
-                            "frequency": row[1] or "",
-                            "start_utc": row[2] or "",
-                            "end_utc": row[3] or "",
-                            "group_name": row[4] or "",
-                        }
-                    )
-                conn.close()
+            db_path = self._daily_db_path
+            stamp = _db_stamp(db_path)
+            if stamp is not None and self._daily_rows_cache and self._daily_rows_cache[0] == stamp:
+                data = self._daily_rows_cache[1]
+            elif stamp is not None:
+                parse = self._parse_hhmm_to_minutes
+                data = [
+                    {
+                        "day_utc": row[0] or "ALL",
+                        "day_mask": _day_mask(row[0]),
+                        "frequency": row[1] or "",
+                        "start_utc": row[2] or "",
+                        "end_utc": row[3] or "",
+                        "start_m": parse(row[2]),
+                        "end_m": parse(row[3]),
+                        "group_name": row[4] or "",
+                    }
+                    for row in self._daily_db().execute(SQL_SELECT_DAILY_SCHEDULE)
+                ]
+                self._daily_rows_cache = (stamp, data)
         except Exception:
             pass
         if not data:
@@ -2596,9 +3127,12 @@ class JS8CallNetControlTab(QWidget):
                     data = [
                         {
                             "day_utc": r.get("day_utc", "ALL"),
+                            "day_mask": _day_mask(r.get("day_utc", "ALL")),
                             "frequency": r.get("frequency", ""),
                             "start_utc": r.get("start_utc", ""),
                             "end_utc": r.get("end_utc", ""),
+                            "start_m": self._parse_hhmm_to_minutes(r.get("start_utc", "")),
+                            "end_m": self._parse_hhmm_to_minutes(r.get("end_utc", "")),
                             "group_name": r.get("group_name", ""),
                         }
                         for r in raw
@@ -2608,34 +3142,37 @@ class JS8CallNetControlTab(QWidget):
                 data = []
         return data
 
-    def _day_matches(self, entry_day: str, now_day: str) -> bool:
-        d = (entry_day or "ALL").strip().upper()
-        if d == "ALL":
-            return True
-        return d.upper() == now_day.upper()
-
     def _is_in_window(self, entry, now: datetime.datetime, allow_early: bool = False) -> bool:
-        day = entry.get("day_utc", "ALL")
+        day_mask = entry["day_mask"] if "day_mask" in entry else _day_mask(entry.get("day_utc", "ALL"))
         start_txt = entry.get("start_utc", "")
         end_txt = entry.get("end_utc", "")
         early = int(entry.get("early_checkin", 0) or 0) if allow_early else 0
-        start_m = self._parse_hhmm_to_minutes(start_txt)
-        end_m = self._parse_hhmm_to_minutes(end_txt)
+        # Loader rows carry pre-parsed minutes; parse only for ad-hoc entries
+        start_m = entry["start_m"] if "start_m" in entry else self._parse_hhmm_to_minutes(start_txt)
+        end_m = entry["end_m"] if "end_m" in entry else self._parse_hhmm_to_minutes(end_txt)
         if start_m is None or end_m is None:
             return False
         start_m = max(0, start_m - early)
         now_m = now.hour * 60 + now.minute
+        wd = now.weekday()
         # Overnight handling
         if start_m <= end_m:
-            return self._day_matches(day, now.strftime("%A")) and start_m <= now_m <= end_m
+            return bool((day_mask >> wd) & 1) and start_m <= now_m <= end_m
         else:
             # window crosses midnight
-            today_match = self._day_matches(day, now.strftime("%A")) and now_m >= start_m
-            prev_day = (now - datetime.timedelta(days=1)).strftime("%A")
-            overnight_match = self._day_matches(day, prev_day) and now_m <= end_m
+            today_match = bool((day_mask >> wd) & 1) and now_m >= start_m
+            overnight_match = bool((day_mask >> ((wd - 1) % 7)) & 1) and now_m <= end_m
             return today_match or overnight_match
 
     def _active_schedule(self) -> Optional[Dict]:
+        t = time.monotonic()
+        if t - self._sched_cache_ts < 1.0:
+            return self._sched_cache_val
+        self._sched_cache_val = self._compute_active_schedule()
+        self._sched_cache_ts = t
+        return self._sched_cache_val
+
+    def _compute_active_schedule(self) -> Optional[Dict]:
         now = datetime.datetime.now(datetime.timezone.utc)
         # Prefer net schedule windows (respect early)
         for row in self._load_net_rows():
@@ -2650,22 +3187,30 @@ class JS8CallNetControlTab(QWidget):
         """
         Return the UTC datetime when the next net window starts (start - early).
         """
+        t = time.monotonic()
+        if t - self._lockout_cache_ts < 1.0:
+            return self._lockout_cache_val
+        self._lockout_cache_val = self._compute_next_net_lockout()
+        self._lockout_cache_ts = t
+        return self._lockout_cache_val
+
+    def _compute_next_net_lockout(self) -> Optional[datetime.datetime]:
         rows = self._load_net_rows()
         if not rows:
             return None
         now = datetime.datetime.now(datetime.timezone.utc)
-        now_day = now.strftime("%A")
         candidates: List[datetime.datetime] = []
         for row in rows:
-            start_m = self._parse_hhmm_to_minutes(row.get("start_utc", ""))
-            end_m = self._parse_hhmm_to_minutes(row.get("end_utc", ""))
+            start_m = row["start_m"] if "start_m" in row else self._parse_hhmm_to_minutes(row.get("start_utc", ""))
+            end_m = row["end_m"] if "end_m" in row else self._parse_hhmm_to_minutes(row.get("end_utc", ""))
             if start_m is None or end_m is None:
                 continue
             early = int(row.get("early_checkin", 0) or 0)
             window_start = max(0, start_m - early)
+            day_mask = row["day_mask"] if "day_mask" in row else _day_mask(row.get("day_utc", ""))
             for day_offset in (0, 1):
                 dt = now + datetime.timedelta(days=day_offset)
-                if not self._day_matches(row.get("day_utc", ""), dt.strftime("%A")):
+                if not (day_mask >> dt.weekday()) & 1:
                     continue
                 cand = dt.replace(hour=0, minute=0, second=0, microsecond=0) + datetime.timedelta(
                     minutes=window_start
@@ -2731,26 +3276,23 @@ class JS8CallNetControlTab(QWidget):
                 base = base.split("/", 1)[0]
             bases.append(base)
 
-        # Track how many chars to use from the end for each base call
-        lengths = [min(3, len(b)) if len(b) < 3 else 3 for b in bases]
-
-        # Gradually extend colliding codes until unique or max length reached
-        while True:
-            codes = [b[-lengths[i]:] for i, b in enumerate(bases)]
-            counts = {}
-            for c in codes:
-                counts[c] = counts.get(c, 0) + 1
-            duplicates = {idx for idx, c in enumerate(codes) if counts[c] > 1}
-            if not duplicates:
-                break
-            progressed = False
-            for idx in duplicates:
-                if lengths[idx] < len(bases[idx]):
-                    lengths[idx] += 1
-                    progressed = True
-            if not progressed:
-                # Cannot disambiguate further (very short/identical bases); exit
-                break
+        # A code needs one more char than its longest shared suffix with any other
+        # base. Sorting by reversed base puts the longest shared suffix next door,
+        # so one pass over adjacent pairs finds it (identical bases stay full length).
+        rev = [b[::-1] for b in bases]
+        shared = [0] * len(bases)
+        order = sorted(range(len(bases)), key=rev.__getitem__)
+        for i, j in zip(order, order[1:]):
+            ri, rj = rev[i], rev[j]
+            n = 0
+            limit = min(len(ri), len(rj))
+            while n < limit and ri[n] == rj[n]:
+                n += 1
+            if n > shared[i]:
+                shared[i] = n
+            if n > shared[j]:
+                shared[j] = n
+        lengths = [max(min(3, len(b)), min(len(b), shared[i] + 1)) for i, b in enumerate(bases)]
 
         return " ".join(bases[i][-lengths[i]:] for i in range(len(bases)))
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QLabel,
     QComboBox,
@@ -12,29 +17,181 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QInputDialog,
 )
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QTextCursor
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextCursor
 
 from freqinout.core.logger import _get_log_file, set_log_level, get_log_level
 from freqinout.core.settings_manager import SettingsManager
 
+# Level token as written by the file handler ("[INFO]") or space-delimited (" INFO ")
+_LEVEL_RE = re.compile(r"[\[ ](DEBUG|INFO|WARNING|ERROR|CRITICAL)[\] ]")
+_LEVEL_COLORS = {
+    "ERROR": "#ff6666",
+    "CRITICAL": "#ff6666",
+    "WARNING": "#ffcc66",
+    "DEBUG": "#66b2ff",
+}
+_DEFAULT_COLOR = "#cccccc"
+
+
+def _read_tail(path, max_lines: int, block_size: int):
+    """
+    Return (lines, end_pos, inode) for the last max_lines complete lines,
+    without line terminators.
+    end_pos is the byte offset just past the last newline read.
+    """
+    try:
+        with open(path, "rb") as f:
+            ino = os.fstat(f.fileno()).st_ino
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            # Scan backwards in blocks until enough newlines are buffered; one
+            # extra newline guarantees the oldest kept line is complete.
+            blocks = []
+            newlines = 0
+            start = size
+            while start > 0 and newlines <= max_lines:
+                step = min(block_size, start)
+                start -= step
+                f.seek(start)
+                block = f.read(step)
+                blocks.append(block)
+                newlines += block.count(b"\n")
+        data = b"".join(reversed(blocks))
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode("utf-8", errors="replace").splitlines()[-max_lines:]
+        return lines, start + end, ino
+    except FileNotFoundError:
+        # Create an empty file so future writes succeed
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).touch()
+        except Exception:
+            pass
+        return ["No log file yet. Use FreqInOut a bit first."], 0, None
+    except Exception as e:
+        return [f"Error reading log: {e}"], 0, None
+
+
+def _poll_log(path, needs_reload: bool, pos: int, inode, last_stat, max_lines: int, block_size: int):
+    """
+    One refresh step. Returns (kind, lines, pos, inode, last_stat) where kind is
+    "reload" (replace the view), "append" (new complete lines) or None (nothing new).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if not needs_reload and st is not None:
+        stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if stat_key == last_stat:
+            return None, [], pos, inode, last_stat
+        last_stat = stat_key
+    if needs_reload or st is None or st.st_ino != inode or st.st_size < pos:
+        lines, pos, inode = _read_tail(path, max_lines, block_size)
+        return "reload", lines, pos, inode, last_stat
+    if st.st_size == pos:
+        return None, [], pos, inode, last_stat
+    with open(path, "rb") as f:
+        f.seek(pos)
+        chunk = f.read()
+    end = chunk.rfind(b"\n")
+    if end < 0:
+        # Only a partial line so far; pick it up once it is terminated
+        return None, [], pos, inode, last_stat
+    lines = chunk[: end + 1].decode("utf-8", errors="replace").splitlines()
+    return "append", lines, pos + end + 1, inode, last_stat
+
+
+class _LogTailReader(QObject):
+    """
+    Runs _poll_log off the GUI thread and posts the result back as one signal.
+    """
+
+    poll_done = Signal(object)  # _poll_log result tuple
+
+    def poll(self, path, needs_reload, pos, inode, last_stat, max_lines, block_size) -> None:
+        try:
+            result = _poll_log(path, needs_reload, pos, inode, last_stat, max_lines, block_size)
+        except Exception:
+            result = (None, [], pos, inode, last_stat)
+        self.poll_done.emit(result)
+
+
+class _LogHighlighter(QSyntaxHighlighter):
+    """
+    Colour each log line (one block) by its level token.
+    """
+
+    def __init__(self, document):
+        super().__init__(document)
+        self._formats = {}
+        for level, color in list(_LEVEL_COLORS.items()) + [(None, _DEFAULT_COLOR)]:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[level] = fmt
+
+    def highlightBlock(self, text):
+        m = _LEVEL_RE.search(text)
+        fmt = self._formats.get(m.group(1) if m else None, self._formats[None])
+        self.setFormat(0, len(text), fmt)
+
 
 class LogViewerTab(QWidget):
-    REFRESH_INTERVAL_MS = 1500
+    # Refresh is driven by QFileSystemWatcher; the timer is only a fallback for
+    # writes the watcher misses (e.g. the file being replaced between events).
+    REFRESH_INTERVAL_MS = 5000
+    DEBOUNCE_MS = 100
+    MAX_LINES = 800
+    TAIL_BLOCK = 8192
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = SettingsManager()
         self.log_file = _get_log_file()
+        # Tail-follow state: byte offset just past the last full line shown, and the
+        # inode it belongs to (a new inode or a shorter file means rotate/truncate).
+        self._log_pos = 0
+        self._log_inode = None
+        self._needs_reload = True
+        self._reload_scheduled = False
+        # (inode, size, mtime_ns) seen by the last tick; unchanged means nothing to do
+        self._last_stat = None
+        # Tail reads run on one worker thread; at most one is in flight, and a
+        # refresh requested meanwhile is replayed when it completes.
+        self._reader = _LogTailReader()
+        self._reader.poll_done.connect(self._on_poll_done)
+        self._read_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-tail")
+        self._read_inflight = False
+        self._refresh_again = False
+        # A burst of writes fires fileChanged repeatedly; restart one short
+        # single-shot timer so the burst is read in a single refresh.
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._on_timer)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(lambda _path: self._debounce.start())
+        self._watch_log_file()
 
         self._build_ui()
         self._apply_saved_level()
-        self._refresh()
+        # First read runs after the window has painted
+        QTimer.singleShot(0, self._refresh)
 
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self._refresh)
+        self.timer.timeout.connect(self._on_timer)
         self.timer.start(self.REFRESH_INTERVAL_MS)
 
+    def _watch_log_file(self):
+        """
+        (Re)register the log with the watcher; it drops paths that are removed or
+        renamed away, as happens on rotation.
+        """
+        path = str(self.log_file)
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+
     def _build_ui(self):
         layout = QVBoxLayout(self)
         toolbar = QHBoxLayout()
@@ -64,16 +221,19 @@ class LogViewerTab(QWidget):
 
         layout.addLayout(toolbar)
 
-        self.text = QTextEdit()
+        # Plain-text document: no rich-text layout, and the block cap trims old lines
+        self.text = QPlainTextEdit()
         self.text.setReadOnly(True)
-        self.text.setStyleSheet("background-color: #111; color: #EEE; font-family: monospace;")
+        self.text.setMaximumBlockCount(self.MAX_LINES)
+        self.text.setStyleSheet("background-color: #111; color: #EEE;")
+        self._highlighter = _LogHighlighter(self.text.document())
         layout.addWidget(self.text)
 
         self.status_label = QLabel(f"Log file: {self.log_file}")
         layout.addWidget(self.status_label)
 
         # connections
-        self.refresh_btn.clicked.connect(self._refresh)
+        self.refresh_btn.clicked.connect(self._request_reload)
         self.clear_btn.clicked.connect(lambda: self.text.clear())
         self.search_btn.clicked.connect(self._search)
         self.open_btn.clicked.connect(self._open_file)
@@ -83,10 +243,9 @@ class LogViewerTab(QWidget):
         self._update_font()
 
     def _update_font(self):
-        size = self.font_spin.value()
-        self.text.setStyleSheet(
-            f"background-color: #111; color: #EEE; font-family: monospace; font-size: {size}pt;"
-        )
+        font = QFont("monospace", self.font_spin.value())
+        font.setStyleHint(QFont.TypeWriter)
+        self.text.setFont(font)
 
     def _apply_saved_level(self):
         saved = (self.settings.get("log_level", "") or "INFO").upper()
@@ -99,48 +258,101 @@ class LogViewerTab(QWidget):
             set_log_level(saved)
 
     def _read_log_tail(self, max_lines=800):
-        try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()[-max_lines:]
-            return lines
-        except FileNotFoundError:
-            # Create an empty file so future writes succeed
-            try:
-                from pathlib import Path
-
-                Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
-                Path(self.log_file).touch()
-            except Exception:
-                pass
-            return ["No log file yet. Use FreqInOut a bit first.\n"]
-        except Exception as e:
-            return [f"Error reading log: {e}\n"]
+        return _read_tail(self.log_file, max_lines, self.TAIL_BLOCK)[0]
 
     def _filter_lines(self, lines):
         level = self.level_combo.currentText()
         if level == "ALL":
             return lines
-        token1 = f"[{level}]"
-        token2 = f" {level} "
-        return [l for l in lines if (token1 in l or token2 in l)]
-
-    def _color_for_line(self, line: str) -> str:
-        if " ERROR " in line or " CRITICAL " in line:
-            return "#ff6666"
-        if " WARNING " in line:
-            return "#ffcc66"
-        if " DEBUG " in line:
-            return "#66b2ff"
-        return "#cccccc"
-
-    def _refresh(self):
-        lines = self._filter_lines(self._read_log_tail())
-        self.text.clear()
+        search = _LEVEL_RE.search
+        out = []
         for line in lines:
-            color = self._color_for_line(line)
-            html_line = f'<span style="color:{color}">{line.rstrip()}</span>'
-            self.text.append(html_line)
+            # Plain substring test rejects most lines before the regex runs
+            if level not in line:
+                continue
+            m = search(line)
+            if m and m.group(1) == level:
+                out.append(line)
+        return out
+
+    def _show_lines(self, lines, max_blocks: int = 0):
+        """
+        Replace the view with `lines`; max_blocks > 0 caps the document so later
+        appends drop the oldest lines instead of growing without bound.
+        """
+        # One setPlainText for the whole buffer; _LogHighlighter colours each block
+        self.text.setMaximumBlockCount(0)
+        self.text.setPlainText("\n".join(lines))
+        self.text.setMaximumBlockCount(max_blocks)
         self.text.moveCursor(QTextCursor.End)
+        self.text.ensureCursorVisible()
+
+    def _append_lines(self, lines):
+        if not lines:
+            return
+        self.text.appendPlainText("\n".join(lines))
+        self.text.moveCursor(QTextCursor.End)
+        self.text.ensureCursorVisible()
+
+    def _request_reload(self):
+        """
+        Mark the view dirty and reload on the next event-loop pass; several requests
+        in a row (e.g. scrolling through the level combo) collapse into one reload.
+        """
+        self._needs_reload = True
+        if self._reload_scheduled:
+            return
+        self._reload_scheduled = True
+        QTimer.singleShot(0, self._refresh)
+
+    def _on_timer(self):
+        # Hidden tab: skip the tick; showEvent catches up when it is displayed again
+        if self.isVisible():
+            self._refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh()
+
+    def _refresh(self):
+        """
+        Queue a tail read: new complete lines are appended, or the view is reloaded
+        after a level change, rotation or truncation.
+        """
+        if self._read_inflight:
+            self._refresh_again = True
+            return
+        self._read_inflight = True
+        needs_reload = self._needs_reload
+        # A reload requested while this read is in flight sets the flag again
+        self._needs_reload = False
+        self._reload_scheduled = False
+        self._read_pool.submit(
+            self._reader.poll,
+            self.log_file,
+            needs_reload,
+            self._log_pos,
+            self._log_inode,
+            self._last_stat,
+            self.MAX_LINES,
+            self.TAIL_BLOCK,
+        )
+
+    def _on_poll_done(self, result):
+        kind, lines, self._log_pos, self._log_inode, self._last_stat = result
+        self._read_inflight = False
+        if kind == "reload":
+            # Rotation drops the path from the watcher; register the new file
+            self._watch_log_file()
+            if self._log_inode is None:
+                # Missing/unreadable log: keep retrying the full reload
+                self._needs_reload = True
+            self._show_lines(self._filter_lines(lines), self.MAX_LINES)
+        elif kind == "append":
+            self._append_lines(self._filter_lines(lines))
+        if self._refresh_again:
+            self._refresh_again = False
+            self._refresh()
 
     def _on_level_changed(self, level: str):
         level = (level or "").upper()
@@ -150,23 +362,21 @@ class LogViewerTab(QWidget):
                 self.settings.set("log_level", level)
             except Exception:
                 pass
-        self._refresh()
+        self._request_reload()
 
     def _search(self):
         term, ok = QInputDialog.getText(self, "Search Logs", "Enter keyword:")
         if not ok or not term:
             return
         lines = self._read_log_tail(1000)
-        matches = [l for l in lines if term.lower() in l.lower()]
+        term_lc = term.lower()
+        matches = [l for l in lines if term_lc in l.lower()]
         if not matches:
             QMessageBox.information(self, "Search", f"No matches for '{term}'.")
             return
-        self.text.clear()
-        for line in matches:
-            color = self._color_for_line(line)
-            html_line = f'<span style="color:{color}">{line.rstrip()}</span>'
-            self.text.append(html_line)
-        self.text.moveCursor(QTextCursor.End)
+        self._show_lines(matches)
+        # Next timer tick restores the live tail
+        self._needs_reload = True
 
     def _open_file(self):
         try:
@@ -6,7 +6,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QStackedWidget,
-    QVBoxLayout,
     QPushButton,
     QButtonGroup,
     QSizePolicy,
@@ -16,8 +15,9 @@ from PySide6.QtWidgets import (
     QGroupBox,
 )
 from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from pathlib import Path
+from typing import Optional
 
 from freqinout.core.logger import log
 from freqinout.core.settings_manager import SettingsManager
@@ -33,11 +33,28 @@ from freqinout.gui.fldigi_net_control_tab import FldigiNetControlTab
 from freqinout.gui.js8call_net_control_tab import JS8CallNetControlTab
 from freqinout.gui.freq_planner_tab import FreqPlannerTab
 from freqinout.gui.operator_history_tab import OperatorHistoryTab
-from freqinout.gui.log_viewer import LogViewerTab
 from freqinout.gui.stations_map_tab import StationsMapTab
 from freqinout.gui.message_viewer_tab import MessageViewerTab
-from freqinout.gui.peer_sched_tab import PeerSchedTab
-from freqinout.gui.help_tab import HelpTab
+
+
+# Tabs built on first visit import their modules lazily too, so their
+# module-level work stays off the startup path.
+def _make_log_tab(parent):
+    from freqinout.gui.log_viewer import LogViewerTab
+
+    return LogViewerTab(parent)
+
+
+def _make_peer_sched_tab(parent):
+    from freqinout.gui.peer_sched_tab import PeerSchedTab
+
+    return PeerSchedTab(parent)
+
+
+def _make_help_tab(parent):
+    from freqinout.gui.help_tab import HelpTab
+
+    return HelpTab(parent)
 
 
 class MainWindow(QMainWindow):
@@ -55,6 +72,8 @@ class MainWindow(QMainWindow):
       - Logs
     """
 
+    _logo_pix: Optional[QPixmap] = None
+
     def __init__(self):
         super().__init__()
 
@@ -66,34 +85,45 @@ class MainWindow(QMainWindow):
         layout = QHBoxLayout(central)
         self.setCentralWidget(central)
 
-        # Instantiate screens
+        # Instantiate screens. Tabs that receive cross-tab signals or run
+        # background timers (JS8 RX, map ingest, message polling) are built
+        # up front; the rest are created on first visit via _tab_factories.
         self.settings_tab = SettingsTab(self)
         self.hf_schedule_tab = DailyScheduleTab(self)  # this tab is labeled "HF Frequency Schedule"
         self.net_tab = NetScheduleTab(self)
         self.fldigi_tab = FldigiNetControlTab(self)
         self.js8_tab = JS8CallNetControlTab(self)
         self.freq_planner_tab = FreqPlannerTab(self)
-        self.operator_history_tab = OperatorHistoryTab(self)
         self.message_viewer_tab = MessageViewerTab(self)
-        self.log_tab = LogViewerTab(self)
         self.stations_map_tab = StationsMapTab(self)
-        self.peer_sched_tab = PeerSchedTab(self)
-        self.help_tab = HelpTab(self)
-
-        # Sidebar navigation order (as requested)
+        self.operator_history_tab = None
+        self.log_tab = None
+        self.peer_sched_tab = None
+        self.help_tab = None
+        self._tab_factories = {
+            "operator_history_tab": lambda: OperatorHistoryTab(self),
+            "log_tab": lambda: _make_log_tab(self),
+            "peer_sched_tab": lambda: _make_peer_sched_tab(self),
+            "help_tab": lambda: _make_help_tab(self),
+        }
+
+        # Tabs whose operator data changed while they were off screen
+        self._stale_screens: set = set()
+
+        # Sidebar navigation order (as requested): (label, attribute name)
         self._screens = [
-            ("FreqPlanner", self.freq_planner_tab),
-            ("Messages", self.message_viewer_tab),
-            ("FLDigi NCS", self.fldigi_tab),
-            ("JS8 NCS", self.js8_tab),
-            ("Operators", self.operator_history_tab),
-            ("Map", self.stations_map_tab),
-            ("HF Schedule", self.hf_schedule_tab),
-            ("Net Schedule", self.net_tab),
-            ("Peer Schedules", self.peer_sched_tab),
-            ("Settings", self.settings_tab),
-            ("Logs", self.log_tab),
-            ("Help", self.help_tab),
+            ("FreqPlanner", "freq_planner_tab"),
+            ("Messages", "message_viewer_tab"),
+            ("FLDigi NCS", "fldigi_tab"),
+            ("JS8 NCS", "js8_tab"),
+            ("Operators", "operator_history_tab"),
+            ("Map", "stations_map_tab"),
+            ("HF Schedule", "hf_schedule_tab"),
+            ("Net Schedule", "net_tab"),
+            ("Peer Schedules", "peer_sched_tab"),
+            ("Settings", "settings_tab"),
+            ("Logs", "log_tab"),
+            ("Help", "help_tab"),
         ]
 
         # Build sidebar
@@ -104,16 +134,12 @@ class MainWindow(QMainWindow):
         nav_layout.setContentsMargins(4, 4, 4, 4)
         nav_layout.setSpacing(4)
 
-        # Logo above nav buttons (optional if file exists)
-        logo_path = Path(__file__).resolve().parents[2] / "assets" / "FreqInOut_logo.png"
-        if logo_path.exists():
-            logo_lbl = QLabel()
-            pix = QPixmap(str(logo_path))
-            if not pix.isNull():
-                pix = pix.scaledToWidth(160, Qt.SmoothTransformation)
-                logo_lbl.setPixmap(pix)
-                logo_lbl.setAlignment(Qt.AlignCenter)
-                nav_layout.addWidget(logo_lbl)
+        # Logo above nav buttons (optional if file exists); pixmap is loaded
+        # after the first paint by _load_logo
+        self.logo_lbl = QLabel()
+        self.logo_lbl.setAlignment(Qt.AlignCenter)
+        self.logo_lbl.setVisible(False)
+        nav_layout.addWidget(self.logo_lbl)
 
         self.nav_buttons = []
         self.button_group = QButtonGroup(self)
@@ -123,10 +149,11 @@ class MainWindow(QMainWindow):
             btn.setCheckable(True)
             btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
             btn.setMinimumWidth(120)
-            btn.clicked.connect(lambda _=False, i=idx: self._set_screen(i))
             self.button_group.addButton(btn, idx)
             self.nav_buttons.append(btn)
             nav_layout.addWidget(btn)
+        # Button ids are the screen indices; one connection serves every button
+        self.button_group.idClicked.connect(self._set_screen)
         # Placeholder for map filters (shown only on Map view)
         self.map_filters_container = QWidget()
         self.map_filters_container.setMinimumWidth(120)
@@ -139,8 +166,10 @@ class MainWindow(QMainWindow):
 
         # Stacked content
         self.stack = QStackedWidget()
-        for _label, widget in self._screens:
-            self.stack.addWidget(widget)
+        for _label, attr in self._screens:
+            widget = getattr(self, attr)
+            # Lazy tabs get an empty placeholder until first shown
+            self.stack.addWidget(widget if widget is not None else QWidget())
 
         # Layout composition
         layout.addWidget(nav_widget)
@@ -163,7 +192,10 @@ class MainWindow(QMainWindow):
         self.rig_client = FLRigClient()
         self.js8_control = JS8ControlClient()
         self.scheduler = SchedulerEngine(self, rig=self.rig_client, js8=self.js8_control)
-        self.scheduler.start()
+        # Defer logo decoding and the first schedule evaluation until the
+        # window is up
+        QTimer.singleShot(0, self._load_logo)
+        QTimer.singleShot(50, self.scheduler.start)
 
         # Wire settings_saved signal
         try:
@@ -197,33 +229,76 @@ class MainWindow(QMainWindow):
         # Sync sidebar filters initially
         self._sync_map_filters_from_tab()
 
+    def _load_logo(self) -> None:
+        """
+        Load and scale the sidebar logo, if the asset exists. The scaled pixmap
+        is kept on the class so later windows skip the smooth rescale.
+        """
+        pix = MainWindow._logo_pix
+        if pix is None:
+            logo_path = Path(__file__).resolve().parents[2] / "assets" / "FreqInOut_logo.png"
+            if not logo_path.exists():
+                return
+            pix = QPixmap(str(logo_path))
+            if pix.isNull():
+                return
+            pix = pix.scaledToWidth(160, Qt.SmoothTransformation)
+            MainWindow._logo_pix = pix
+        self.logo_lbl.setPixmap(pix)
+        self.logo_lbl.setVisible(True)
+
     def refresh_operator_history_views(self):
         """
         Reload operator history across tabs so new entries (e.g., CSV import, JS8 load)
-        are visible without restarting.
+        are visible without restarting. Tabs that are not on screen are only marked
+        stale and reload when next shown (see _set_screen).
         """
+        current = self._current_screen_attr()
+        for attr in ("operator_history_tab", "stations_map_tab", "fldigi_tab"):
+            if getattr(self, attr, None) is None:
+                # Not built yet; it loads fresh data when first shown
+                continue
+            if attr == current:
+                self._refresh_operator_view(attr)
+            else:
+                self._stale_screens.add(attr)
+
+    def _current_screen_attr(self) -> str | None:
+        index = self.stack.currentIndex()
+        if 0 <= index < len(self._screens):
+            return self._screens[index][1]
+        return None
+
+    def _refresh_operator_view(self, attr: str) -> None:
+        """
+        Reload operator history data in one tab.
+        """
+        tab = getattr(self, attr, None)
         try:
-            if hasattr(self.operator_history_tab, "_load_data"):
-                self.operator_history_tab._load_data()
-        except Exception as e:
-            log.debug("MainWindow: operator_history_tab refresh failed: %s", e)
-        try:
-            if hasattr(self.stations_map_tab, "_load_operator_history"):
-                self.stations_map_tab._load_operator_history()
-                if hasattr(self.stations_map_tab, "_render_map"):
-                    self.stations_map_tab._render_map(preserve_view=True)
-        except Exception as e:
-            log.debug("MainWindow: stations_map_tab refresh failed: %s", e)
-        try:
-            if hasattr(self.fldigi_tab, "_load_known_operators"):
-                self.fldigi_tab._load_known_operators()
+            if attr == "operator_history_tab":
+                if hasattr(tab, "_load_data"):
+                    tab._load_data()
+            elif attr == "stations_map_tab":
+                if hasattr(tab, "_load_operator_history"):
+                    tab._load_operator_history()
+                    if hasattr(tab, "_render_map"):
+                        tab._render_map(preserve_view=True)
+            elif attr == "fldigi_tab":
+                if hasattr(tab, "_load_known_operators"):
+                    tab._load_known_operators()
         except Exception as e:
-            log.debug("MainWindow: fldigi_tab refresh failed: %s", e)
+            log.debug("MainWindow: %s refresh failed: %s", attr, e)
 
     def _init_map_filters(self) -> None:
         """
         Build a static sidebar panel for map display filters (no reparenting).
         """
+        # Several checkbox/combo changes in a row collapse into one render
+        self._map_render_timer = QTimer(self)
+        self._map_render_timer.setSingleShot(True)
+        self._map_render_timer.setInterval(150)
+        self._map_render_timer.timeout.connect(self._do_map_render)
+
         box = QGroupBox("Map Layers")
         box.setCheckable(False)
         v = QVBoxLayout(box)
@@ -330,16 +405,26 @@ class MainWindow(QMainWindow):
                     tab.city_pop_combo.blockSignals(False)
             except Exception:
                 pass
-        # Persist and redraw
+        # Persist and redraw once the burst of changes settles
+        self._map_render_timer.start()
+
+    def _do_map_render(self) -> None:
+        """
+        Save map display preferences and redraw after sidebar changes.
+        """
+        tab = getattr(self, "stations_map_tab", None)
+        if not tab:
+            return
         if hasattr(tab, "_save_display_preferences"):
             tab._save_display_preferences()
         if hasattr(tab, "_render_map"):
             tab._render_map()
+
     def _update_map_filters_visibility(self, index: int) -> None:
         """
         Show the stations-map 'Show' filters in the sidebar only when the Map view is active.
         """
-        is_map = 0 <= index < len(self._screens) and self._screens[index][1] is self.stations_map_tab
+        is_map = 0 <= index < len(self._screens) and self._screens[index][1] == "stations_map_tab"
         if not is_map or self.map_filters_layout is None:
             self.map_filters_container.setVisible(False)
             return
@@ -357,24 +442,51 @@ class MainWindow(QMainWindow):
         window (e.g., after saving a new callsign) by doing:
             self.parent()._apply_callsign_to_tab_titles()
         """
-        data = self.settings.all()
-        callsign = (data.get("callsign") or "").strip().upper()
-        if not callsign:
-            # Reset to base titles if no callsign is set
-            for idx, (base, _w) in enumerate(self._screens):
-                if idx < len(self.nav_buttons):
-                    self.nav_buttons[idx].setText(base)
+        callsign = (self.settings.get("callsign") or "").strip().upper()
+        if callsign == getattr(self, "_last_callsign", None):
             return
+        self._last_callsign = callsign
 
-        def label(base: str) -> str:
-            return f"{base} [{callsign}]"
+        # Batch the label changes into a single re-layout
+        self.setUpdatesEnabled(False)
+        try:
+            for idx, (base, _w) in enumerate(self._screens):
+                if idx < len(self.nav_buttons):
+                    # Reset to base titles if no callsign is set
+                    self.nav_buttons[idx].setText(f"{base} [{callsign}]" if callsign else base)
+        finally:
+            self.setUpdatesEnabled(True)
 
-        for idx, (base, _w) in enumerate(self._screens):
-            lbl = label(base)
-            if idx < len(self.nav_buttons):
-                self.nav_buttons[idx].setText(lbl)
+    def _ensure_screen(self, index: int) -> None:
+        """
+        Build a lazily created tab on first visit and swap it in for its
+        placeholder in the stack.
+        """
+        attr = self._screens[index][1]
+        if getattr(self, attr) is not None:
+            return
+        factory = self._tab_factories.get(attr)
+        if factory is None:
+            return
+        try:
+            widget = factory()
+        except Exception as e:
+            log.error("MainWindow: failed to create %s: %s", attr, e)
+            return
+        del self._tab_factories[attr]
+        setattr(self, attr, widget)
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, widget)
+        if placeholder is not None:
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
 
     def _set_screen(self, index: int) -> None:
         if 0 <= index < self.stack.count():
+            self._ensure_screen(index)
+            attr = self._screens[index][1]
+            if attr in self._stale_screens:
+                self._stale_screens.discard(attr)
+                self._refresh_operator_view(attr)
             self.stack.setCurrentIndex(index)
             self._update_map_filters_visibility(index)
@@ -4,13 +4,15 @@ import json
 import os
 import sqlite3
 import subprocess
-import xml.dom.minidom
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-from PySide6.QtCore import Qt, QTimer, QUrl
+from PySide6.QtCore import QCoreApplication, QFileSystemWatcher, QObject, Qt, QTimer, QUrl, Signal
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QWidget,
@@ -27,14 +29,11 @@ from PySide6.QtWidgets import (
     QComboBox,
 )
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-
 from freqinout.core.settings_manager import SettingsManager
 from freqinout.core.logger import log
 
 
-SUPPORTED_EXT = {".b2s", ".k2s", ".txt", ".ff", ".xml", ".json", ".html", ".htm"}
+SUPPORTED_EXT = frozenset({".b2s", ".k2s", ".txt", ".ff", ".xml", ".json", ".html", ".htm"})
 
 DEFAULT_WATCH_DIRS = [
     {"path": r"C:\VarAC", "origin": "varac"},
@@ -46,13 +45,229 @@ SCAN_CHOICES = [1, 15, 30, 60]  # minutes
 JS8_POLL_SECONDS = 180  # 3 minutes
 JS8_MAX_AGE_SECONDS = 30 * 24 * 60 * 60  # 30 days
 
+# Local JS8 cache in freqinout_nets.db. Fixed statement text lets the
+# connection's statement cache reuse the prepared statements.
+SQL_CREATE_JS8_MESSAGES = """
+CREATE TABLE IF NOT EXISTS js8_messages (
+    id INTEGER PRIMARY KEY,
+    from_call TEXT,
+    to_call TEXT,
+    msg_type TEXT,
+    utc_str TEXT,
+    utc_ts REAL,
+    raw_text TEXT,
+    decoded_text TEXT,
+    state TEXT,
+    read_ts REAL
+)
+"""
+SQL_CREATE_JS8_INBOX_STATE = (
+    "CREATE TABLE IF NOT EXISTS js8_inbox_state (id INTEGER PRIMARY KEY, state TEXT, last_seen REAL, read_ts REAL, last_ingested_id INTEGER)"
+)
+SQL_SELECT_JS8_STATE = "SELECT id, state, read_ts FROM js8_inbox_state"
+SQL_UPSERT_JS8_STATE = (
+    "INSERT INTO js8_inbox_state (id, state, last_seen, read_ts) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET state=excluded.state, last_seen=excluded.last_seen, read_ts=excluded.read_ts"
+)
+SQL_MAX_JS8_ID = "SELECT MAX(id) FROM js8_messages"
+SQL_INSERT_JS8_MESSAGE = """
+INSERT INTO js8_messages (id, from_call, to_call, msg_type, utc_str, utc_ts, raw_text, decoded_text, state, read_ts)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO NOTHING
+"""
+SQL_UPDATE_JS8_DECODED = "UPDATE js8_messages SET decoded_text=? WHERE id=?"
+SQL_UPDATE_JS8_READ = "UPDATE js8_messages SET state='READ', read_ts=? WHERE id=?"
+SQL_SELECT_JS8_RECENT = """
+SELECT id, from_call, to_call, msg_type, utc_str, utc_ts, raw_text, decoded_text, state, read_ts
+FROM js8_messages
+WHERE utc_ts IS NULL OR utc_ts >= ?
+"""
+
+
+def _iter_files(base: str, prev: Dict | None = None, seen: Dict | None = None):
+    """
+    Yield (path, size, mtime) for supported files under base, walking with
+    os.scandir so directory entries supply the type and stat information.
 
-@dataclass
+    prev/seen map directory -> (st_mtime_ns, file_paths, subdirs). A directory
+    whose mtime matches prev reuses its listing instead of being re-read, but
+    each file is still stat'ed since rewriting a file in place does not touch
+    the directory mtime; every directory visited is recorded in seen.
+    """
+    stack = [base]
+    while stack:
+        d = stack.pop()
+        try:
+            dir_mtime = os.stat(d).st_mtime_ns
+        except OSError:
+            continue
+        hit = prev.get(d) if prev else None
+        if hit is not None and hit[0] == dir_mtime:
+            paths, subdirs = hit[1], hit[2]
+            files = []
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((path, st.st_size, st.st_mtime))
+        else:
+            paths, files, subdirs = [], [], []
+            try:
+                it = os.scandir(d)
+            except OSError:
+                continue
+            with it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            subdirs.append(e.path)
+                            continue
+                        if os.path.splitext(e.name)[1].lower() not in SUPPORTED_EXT:
+                            continue
+                        if not e.is_file():
+                            continue
+                        st = e.stat()
+                    except OSError:
+                        continue
+                    paths.append(e.path)
+                    files.append((e.path, st.st_size, st.st_mtime))
+        if seen is not None:
+            seen[d] = (dir_mtime, paths, subdirs)
+        stack.extend(subdirs)
+        yield from files
+
+
+def _scan_watch_dirs(watch_dirs: List[Dict], prev: Dict | None = None, seen: Dict | None = None) -> Dict[str, List["FileRecord"]]:
+    """
+    Collect FileRecords per origin for the configured watch dirs, newest first.
+    """
+    records: Dict[str, List[FileRecord]] = {"varac": [], "flmsg": [], "flamp": []}
+    for entry in watch_dirs:
+        origin = entry.get("origin", "unknown")
+        if origin not in records:
+            continue
+        p = entry.get("path", "")
+        if not p:
+            continue
+        for path, size, mtime in _iter_files(p, prev, seen):
+            records[origin].append(FileRecord(path=Path(path), origin=origin, size=size, mtime=mtime))
+
+    # Sort by mtime desc
+    for origin in records:
+        records[origin].sort(key=lambda r: r.mtime, reverse=True)
+    return records
+
+
+class _FileScanner(QObject):
+    """
+    Runs _scan_watch_dirs off the GUI thread and posts the records back as one signal.
+    """
+
+    scan_done = Signal(object, object)  # {origin: [FileRecord, ...]}, [scanned dirs]
+
+    def __init__(self):
+        super().__init__()
+        # Per-directory listings from the last scan; only touched on the worker thread
+        self._dir_cache: Dict[str, Tuple[int, list, list]] = {}
+
+    def scan(self, watch_dirs: List[Dict], full: bool = False) -> None:
+        """
+        Rescan the watch dirs. Unchanged directories (same mtime) reuse their
+        cached listing unless full is set; listed files are re-stat'ed either way.
+        """
+        seen: Dict[str, Tuple[int, list, list]] = {}
+        try:
+            records = _scan_watch_dirs(watch_dirs, None if full else self._dir_cache, seen)
+            self._dir_cache = seen
+        except Exception as e:
+            log.error("MessageViewer: directory scan failed: %s", e)
+            records = None
+        self.scan_done.emit(records, list(seen))
+
+
+def _write_pdf(fn: str, text: str) -> None:
+    """
+    Render text to a letter-size PDF, wrapping long lines.
+    """
+    import textwrap
+
+    # reportlab is only needed for export; keep it off the startup path
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(fn, pagesize=letter)
+    width, height = letter
+    margin = 50
+    usable_width = width - 2 * margin
+    line_height = 14
+    # Roughly estimate characters per line at 12pt Helvetica (~6.5 px avg)
+    max_chars = max(40, int(usable_width / 6.5))
+    lines_per_page = int((height - 2 * margin) // line_height) + 1
+
+    def new_page():
+        t = c.beginText(margin, height - margin)
+        t.setFont("Helvetica", 12)
+        t.setLeading(line_height)
+        return t
+
+    t = new_page()
+    on_page = 0
+    for raw_line in text.split("\n"):
+        for line in textwrap.wrap(raw_line, max_chars) or [""]:
+            if on_page == lines_per_page:
+                c.drawText(t)
+                c.showPage()
+                t = new_page()
+                on_page = 0
+            t.textLine(line)
+            on_page += 1
+    c.drawText(t)
+    c.save()
+
+
+class _Js8Loader(QObject):
+    """
+    Runs the JS8 ingest/load callable off the GUI thread and posts the messages back.
+    """
+
+    loaded = Signal(object)  # [JS8Message, ...] or None on failure
+
+    def load(self, collect) -> None:
+        try:
+            msgs = collect()
+        except Exception as e:
+            log.debug("MessageViewer: JS8 local load failed: %s", e)
+            msgs = None
+        self.loaded.emit(msgs)
+
+
+class _PdfExporter(QObject):
+    """
+    Runs _write_pdf off the GUI thread and reports (filename, error) back.
+    """
+
+    export_done = Signal(str, str)  # filename, error message ("" on success)
+
+    def export(self, fn: str, text: str) -> None:
+        try:
+            _write_pdf(fn, text)
+            error = ""
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        self.export_done.emit(fn, error)
+
+
+@dataclass(frozen=True)
 class FileRecord:
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10); no field
+    # defaults, since class-level defaults would clash with the slots
+    __slots__ = ("path", "origin", "size", "mtime")
+
     path: Path
     origin: str
-    size: int = 0
-    mtime: float = 0.0
+    size: int
+    mtime: float
 
     def display_name(self) -> str:
         return self.path.name
@@ -85,9 +300,14 @@ class MessageViewerTab(QWidget):
     - Watches configured folders by origin
     - Lists files per origin; shows content preview
     - Open externally and export to PDF
-    - Scan interval selectable (1 / 15 / 30 / 60 minutes)
+    - Rescans on directory change notifications; scan interval selectable
+      (1 / 15 / 30 / 60 minutes) as a fallback
     """
 
+    MAX_WATCHED_DIRS = 512  # stay well under per-process inotify limits
+    CONTENT_CACHE_SIZE = 64  # formatted previews kept for repeat clicks
+    MAX_PREVIEW_CHARS = 1_000_000  # larger files are previewed truncated
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = SettingsManager()
@@ -99,7 +319,7 @@ class MessageViewerTab(QWidget):
             if p:
                 self.watch_dirs.append({"path": p, "origin": origin})
         if not self.watch_dirs:
-            self.watch_dirs = DEFAULT_WATCH_DIRS
+            self.watch_dirs = [dict(d) for d in DEFAULT_WATCH_DIRS]
         self.scan_minutes: int = cfg.get("scan_minutes") or 15
         if self.scan_minutes not in SCAN_CHOICES:
             self.scan_minutes = 15
@@ -110,15 +330,58 @@ class MessageViewerTab(QWidget):
         self._form_cache: Dict[str, List[Dict]] = {}
         self.forms_path = (self.settings.get("js8_forms_path", "") or "").strip()
 
+        # Shared DB connections, opened on first use and closed at shutdown.
+        # Every DB call runs on the msg-js8 worker so one thread owns them.
+        self._db_conn: sqlite3.Connection | None = None
+        self._db_path_cached: Path | None = None
+        self._js8_tables_ready = False
+        self._inbox_conn: sqlite3.Connection | None = None
+        self._inbox_conn_path = ""
+        self._js8_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msg-js8")
+        self._db_closed = False
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._close_db)
+
         # merge DB paths if present
         self._load_watch_dirs_from_db()
 
         self.files: Dict[str, List[FileRecord]] = {"varac": [], "flmsg": [], "flamp": []}
         self.current_record: FileRecord | None = None
+        self._content_cache: OrderedDict[tuple, str] = OrderedDict()
+        # (path, mtime, size) per row currently shown in each file list
+        self._list_keys: Dict[str, List[tuple]] = {}
 
         self._timer: QTimer | None = None
         self.paths_labels: Dict[str, QLabel] = {}
 
+        # Directory scans run on one worker thread so large trees don't block the UI
+        self._scanner = _FileScanner()
+        self._scanner.scan_done.connect(self._on_scan_done)
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msg-scan")
+        self._scan_inflight = False
+        self._scan_again = False
+        self._scan_full = False
+
+        # PDF rendering gets its own worker so a long export never delays a scan
+        self._pdf_exporter = _PdfExporter()
+        self._pdf_exporter.export_done.connect(self._on_pdf_done)
+        self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msg-pdf")
+
+        # JS8 inbox ingest and cache reads report back through this signal
+        self._js8_loader = _Js8Loader()
+        self._js8_loader.loaded.connect(self._on_js8_loaded)
+        self._js8_inflight = False
+        self._js8_again = False
+
+        # Change notifications trigger a rescan; the scan-interval timer stays as a fallback
+        self._fsw = QFileSystemWatcher(self)
+        self._fsw.directoryChanged.connect(self._on_dir_changed)
+        self._fsw_debounce = QTimer(self)
+        self._fsw_debounce.setSingleShot(True)
+        self._fsw_debounce.setInterval(500)
+        self._fsw_debounce.timeout.connect(self._refresh_files)
+
         self._build_ui()
         self._load_paths_lists()
         self._refresh_files()
@@ -129,28 +392,84 @@ class MessageViewerTab(QWidget):
     # ---------- DB helpers ----------
 
     def _db_path(self) -> Path | None:
-        try:
-            root = Path(__file__).resolve().parents[2]
-            from freqinout.core.config_paths import get_config_dir
+        # Resolved once per tab; the config dir does not move while running
+        if self._db_path_cached is None:
+            try:
+                from freqinout.core.config_paths import get_config_dir
+
+                self._db_path_cached = get_config_dir() / "config" / "freqinout_nets.db"
+            except Exception as e:
+                log.error("MessageViewer: failed to resolve DB path: %s", e)
+                return None
+        return self._db_path_cached
+
+    def _db(self) -> sqlite3.Connection | None:
+        """
+        Return the shared freqinout_nets.db connection, opening it on first use.
+        PRAGMAs and the message_viewer_paths DDL run once here rather than per call.
+        """
+        if self._db_conn is None:
+            db_path = self._db_path()
+            if not db_path:
+                return None
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=128)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-16000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS message_viewer_paths (origin TEXT, path TEXT UNIQUE)"
+            )
+            conn.commit()
+            self._db_conn = conn
+        return self._db_conn
+
+    def _inbox_db(self, inbox_path: Path) -> sqlite3.Connection:
+        """
+        Return a connection to JS8Call's inbox DB, reopened only if the path changes.
+        """
+        key = str(inbox_path)
+        if self._inbox_conn is None or self._inbox_conn_path != key:
+            if self._inbox_conn is not None:
+                try:
+                    self._inbox_conn.close()
+                except Exception:
+                    pass
+            self._inbox_conn = sqlite3.connect(inbox_path, check_same_thread=False, cached_statements=32)
+            self._inbox_conn_path = key
+        return self._inbox_conn
 
-            return get_config_dir() / "config" / "freqinout_nets.db"
+    def _close_db(self) -> None:
+        """
+        Close the shared connections (app shutdown). The JS8 worker is drained
+        first so queued writes land and nothing is using the connections.
+        """
+        if self._db_closed:
+            return
+        self._db_closed = True
+        if self._js8_timer:
+            self._js8_timer.stop()
+        try:
+            self._js8_pool.shutdown(wait=True)
         except Exception as e:
-            log.error("MessageViewer: failed to resolve DB path: %s", e)
-            return None
+            log.debug("MessageViewer: JS8 worker shutdown failed: %s", e)
+        for attr in ("_db_conn", "_inbox_conn"):
+            conn = getattr(self, attr)
+            if conn is None:
+                continue
+            try:
+                conn.close()
+            except Exception as e:
+                log.debug("MessageViewer: closing %s failed: %s", attr, e)
+            setattr(self, attr, None)
 
     def _load_watch_dirs_from_db(self):
         db_path = self._db_path()
         if not db_path or not db_path.exists():
             return
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                "CREATE TABLE IF NOT EXISTS message_viewer_paths (origin TEXT, path TEXT UNIQUE)"
-            )
-            cur.execute("SELECT origin, path FROM message_viewer_paths")
-            rows = cur.fetchall()
-            conn.close()
+            rows = self._js8_pool.submit(self._read_watch_dir_rows).result()
             existing = {(w.get("origin"), w.get("path")) for w in self.watch_dirs}
             for origin, path in rows:
                 if (origin, path) not in existing:
@@ -158,28 +477,29 @@ class MessageViewerTab(QWidget):
         except Exception as e:
             log.error("MessageViewer: failed to load watch dirs from DB: %s", e)
 
+    def _read_watch_dir_rows(self) -> list:
+        return self._db().execute("SELECT origin, path FROM message_viewer_paths").fetchall()
+
     def _save_paths_to_db(self):
-        db_path = self._db_path()
-        if not db_path:
+        if self._db_closed:
             return
+        rows = [(w.get("origin"), w.get("path")) for w in self.watch_dirs if w.get("path")]
+        self._js8_pool.submit(self._write_watch_dir_rows, rows)
+
+    def _write_watch_dir_rows(self, rows: list) -> None:
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                "CREATE TABLE IF NOT EXISTS message_viewer_paths (origin TEXT, path TEXT UNIQUE)"
-            )
-            cur.execute("DELETE FROM message_viewer_paths")
-            cur.executemany(
-                "INSERT OR IGNORE INTO message_viewer_paths (origin, path) VALUES (?, ?)",
-                [(w.get("origin"), w.get("path")) for w in self.watch_dirs if w.get("path")],
-            )
-            conn.commit()
-            conn.close()
+            conn = self._db()
+            if conn is None:
+                return
+            with conn:
+                conn.execute("DELETE FROM message_viewer_paths")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO message_viewer_paths (origin, path) VALUES (?, ?)",
+                    rows,
+                )
         except Exception as e:
             log.error("MessageViewer: failed to save watch dirs to DB: %s", e)
 
-    # ---------- UI ----------
-
     def _build_ui(self):
         layout = QVBoxLayout(self)
 
@@ -196,7 +516,7 @@ class MessageViewerTab(QWidget):
         header.addWidget(self.scan_combo)
 
         self.refresh_btn = QPushButton("Refresh Now")
-        self.refresh_btn.clicked.connect(self._refresh_files)
+        self.refresh_btn.clicked.connect(lambda: self._refresh_files(full=True))
         header.addWidget(self.refresh_btn)
 
         self.open_btn = QPushButton("Open Externally")
@@ -277,6 +597,25 @@ class MessageViewerTab(QWidget):
         self._js8_timer.timeout.connect(self._refresh_js8_messages)
         self._js8_timer.start(JS8_POLL_SECONDS * 1000)
 
+    def _watch_dirs(self, dirs: List[str]):
+        """
+        Point the file-system watcher at the directories found by the last scan.
+        """
+        dirs = dirs[:self.MAX_WATCHED_DIRS]
+        watched = set(self._fsw.directories())
+        wanted = set(dirs)
+        stale = [d for d in watched if d not in wanted]
+        if stale:
+            self._fsw.removePaths(stale)
+        new = [d for d in dirs if d not in watched]
+        if new:
+            # Unsupported/unwatchable paths are returned here and left to the poll timer
+            self._fsw.addPaths(new)
+
+    def _on_dir_changed(self, _path: str):
+        # Bursts of writes (e.g. a message arriving in several files) collapse into one scan
+        self._fsw_debounce.start()
+
     def _on_scan_changed(self):
         val = self.scan_combo.currentData()
         if not val:
@@ -288,6 +627,9 @@ class MessageViewerTab(QWidget):
     # ---------- Paths ----------
 
     def _load_paths_lists(self):
+        """
+        Refresh the per-origin path labels; call after watch_dirs changes.
+        """
         by_origin: Dict[str, List[str]] = {"varac": [], "flmsg": [], "flamp": []}
         for entry in self.watch_dirs:
             origin = entry.get("origin", "unknown")
@@ -304,92 +646,158 @@ class MessageViewerTab(QWidget):
         if not fn:
             return
         self.watch_dirs.append({"path": fn, "origin": origin})
-        self._save_settings()
+        # Watch paths are session-only here (configured in Settings); scan_minutes
+        # is unchanged, so there is nothing for _save_settings to persist
+        self._load_paths_lists()
         self._refresh_files()
 
     def _remove_path(self, origin: str):
         # remove last added path for this origin (or prompt later)
-        paths = [w for w in self.watch_dirs if w.get("origin") == origin]
-        if not paths:
+        for i in range(len(self.watch_dirs) - 1, -1, -1):
+            if self.watch_dirs[i].get("origin") == origin:
+                del self.watch_dirs[i]
+                break
+        else:
             return
-        last = paths[-1]
-        self.watch_dirs = [w for w in self.watch_dirs if not (w.get("origin") == origin and w.get("path") == last.get("path"))]
-        self._save_settings()
+        self._load_paths_lists()
         self._refresh_files()
 
     # ---------- Scanning ----------
 
-    def _refresh_files(self):
-        self._load_paths_lists()
-        records: Dict[str, List[FileRecord]] = {"varac": [], "flmsg": [], "flamp": []}
-        for entry in self.watch_dirs:
-            origin = entry.get("origin", "unknown")
-            if origin not in records:
-                continue
-            p = entry.get("path", "")
-            if not p:
-                continue
-            base = Path(p)
-            if not base.exists():
-                continue
-            for f in base.glob("**/*"):
-                if not f.is_file():
-                    continue
-                if f.suffix.lower() not in SUPPORTED_EXT:
-                    continue
-                try:
-                    st = f.stat()
-                except OSError:
-                    continue
-                rec = FileRecord(path=f, origin=origin, size=st.st_size, mtime=st.st_mtime)
-                records[origin].append(rec)
-
-        # Sort by mtime desc
-        for origin in records:
-            records[origin].sort(key=lambda r: r.mtime, reverse=True)
-
-        self.files = records
-        self._populate_lists()
+    def _refresh_files(self, full: bool = False):
+        """
+        Queue a directory scan on the worker thread; _on_scan_done fills the lists.
+        full=True re-reads every directory instead of reusing unchanged listings.
+        """
+        self._scan_full = self._scan_full or full
+        if self._scan_inflight:
+            # Paths may have changed since the running scan started
+            self._scan_again = True
+            return
+        self._scan_inflight = True
+        full, self._scan_full = self._scan_full, False
+        self._scan_pool.submit(self._scanner.scan, [dict(e) for e in self.watch_dirs], full)
+
+    def _on_scan_done(self, records, dirs):
+        self._scan_inflight = False
+        if records is not None:
+            self.files = records
+            self._on_files_rescanned()
+            self._watch_dirs(dirs)
+        if self._scan_again:
+            self._scan_again = False
+            self._refresh_files()
 
     def _refresh_js8_messages(self):
+        """
+        Queue a JS8 ingest + local cache read on the JS8 worker; _on_js8_loaded
+        shows the result.
+        """
+        if self._db_closed:
+            return
+        if self._js8_inflight:
+            self._js8_again = True
+            return
+        self._js8_inflight = True
+        self._js8_pool.submit(self._js8_loader.load, self._collect_js8_messages)
+
+    def _collect_js8_messages(self) -> List[JS8Message]:
+        """
+        Worker thread: ingest new inbox rows into the local cache, then read it back.
+        """
         # First ingest any new messages into local cache, then load from local cache for display
         try:
             self._ingest_js8_messages()
         except Exception as e:
             log.debug("MessageViewer: JS8 ingest failed: %s", e)
-        try:
-            self._load_js8_from_local()
-        except Exception as e:
-            log.debug("MessageViewer: JS8 local load failed: %s", e)
+        return self._load_js8_from_local()
+
+    def _on_js8_loaded(self, msgs):
+        self._js8_inflight = False
+        if msgs is not None:
+            self.js8_messages = msgs
+            self._populate_lists()
+        if self._js8_again:
+            self._js8_again = False
+            self._refresh_js8_messages()
 
     def _populate_lists(self):
+        self._populate_file_lists()
+        self._populate_js8_list()
+        self._reset_viewer()
+
+    def _on_files_rescanned(self):
+        # A scan that changed nothing leaves the lists and the open preview alone
+        if self._populate_file_lists():
+            self._reset_viewer()
+
+    @staticmethod
+    def _file_item(rec: FileRecord) -> QListWidgetItem:
+        item = QListWidgetItem(rec.display_name())
+        item.setData(Qt.UserRole, rec)
+        return item
+
+    def _populate_file_lists(self) -> bool:
+        """
+        Bring the VarAC/FLMSG/FLAMP lists in line with self.files, removing and
+        inserting only the rows that changed. Returns True if any list changed.
+        """
         mapping = {
             "varac": self.list_varac,
             "flmsg": self.list_flmsg,
             "flamp": self.list_flamp,
         }
+        changed = False
         for origin, lst in mapping.items():
+            recs = self.files.get(origin, [])
+            new_keys = [(str(r.path), r.mtime, r.size) for r in recs]
+            old_keys = self._list_keys.get(origin, [])
+            if new_keys == old_keys:
+                continue
+            changed = True
+            new_set = set(new_keys)
+            # One repaint/layout for the whole batch instead of one per row
+            lst.setUpdatesEnabled(False)
             lst.blockSignals(True)
-            lst.clear()
-            for rec in self.files.get(origin, []):
-                item = QListWidgetItem(rec.display_name())
-                item.setData(Qt.UserRole, rec)
-                lst.addItem(item)
-            lst.blockSignals(False)
-
-        # JS8 messages
+            try:
+                for row in range(len(old_keys) - 1, -1, -1):
+                    if old_keys[row] not in new_set:
+                        lst.takeItem(row)
+                kept = [k for k in old_keys if k in new_set]
+                kept_set = set(kept)
+                if kept != [k for k in new_keys if k in kept_set]:
+                    # Surviving rows changed order; rebuild this list
+                    lst.clear()
+                    for rec in recs:
+                        lst.addItem(self._file_item(rec))
+                else:
+                    for row, (key, rec) in enumerate(zip(new_keys, recs)):
+                        if key not in kept_set:
+                            lst.insertItem(row, self._file_item(rec))
+            finally:
+                lst.blockSignals(False)
+                lst.setUpdatesEnabled(True)
+            self._list_keys[origin] = new_keys
+        return changed
+
+    def _populate_js8_list(self):
         if hasattr(self, "list_js8"):
+            self.list_js8.setUpdatesEnabled(False)
             self.list_js8.blockSignals(True)
-            self.list_js8.clear()
-            for msg in self.js8_messages:
-                item = QListWidgetItem(msg.display_line())
-                item.setData(Qt.UserRole, msg)
-                # visually indicate unread
-                if msg.state.upper() == "UNREAD":
-                    item.setForeground(Qt.red)
-                self.list_js8.addItem(item)
-            self.list_js8.blockSignals(False)
-
+            try:
+                self.list_js8.clear()
+                for msg in self.js8_messages:
+                    item = QListWidgetItem(msg.display_line())
+                    item.setData(Qt.UserRole, msg)
+                    # visually indicate unread
+                    if msg.state.upper() == "UNREAD":
+                        item.setForeground(Qt.red)
+                    self.list_js8.addItem(item)
+            finally:
+                self.list_js8.blockSignals(False)
+                self.list_js8.setUpdatesEnabled(True)
+
+    def _reset_viewer(self):
         self.info_label.setText("No file selected")
         self.viewer.clear()
         self.current_record = None
@@ -414,6 +822,10 @@ class MessageViewerTab(QWidget):
         rec = item.data(Qt.UserRole)
         if isinstance(rec, FileRecord):
             self.current_js8 = None
+            fresh = self._restat_record(rec)
+            if fresh is not rec:
+                item.setData(Qt.UserRole, fresh)
+                rec = fresh
             self.current_record = rec
             self._load_content(rec)
         elif isinstance(rec, JS8Message):
@@ -422,12 +834,47 @@ class MessageViewerTab(QWidget):
             self._load_js8_content(rec)
             self._mark_js8_read(rec)
 
-    def _load_content(self, rec: FileRecord):
+    @staticmethod
+    def _restat_record(rec: FileRecord) -> FileRecord:
+        """
+        Return rec with the file's current size/mtime; the scan-time values go
+        stale when a file is rewritten in place between scans.
+        """
         try:
-            data = rec.path.read_text(encoding="utf-8", errors="replace")
-        except Exception as e:
-            self.viewer.setPlainText(f"Failed to read file:\n{e}")
-            return
+            st = rec.path.stat()
+        except OSError:
+            return rec
+        if st.st_size == rec.size and st.st_mtime == rec.mtime:
+            return rec
+        return FileRecord(path=rec.path, origin=rec.origin, size=st.st_size, mtime=st.st_mtime)
+
+    def _load_content(self, rec: FileRecord):
+        key = (str(rec.path), rec.mtime, rec.size)
+        content = self._content_cache.get(key)
+        if content is not None:
+            self._content_cache.move_to_end(key)
+        else:
+            try:
+                content = self._format_content(rec)
+            except Exception as e:
+                self.viewer.setPlainText(f"Failed to read file:\n{e}")
+                return
+            # mtime/size in the key drop stale entries once the file changes
+            self._content_cache[key] = content
+            if len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+
+        info = f"{rec.path.name} — {rec.origin.upper()} — {rec.size} bytes — {self._fmt_mtime(rec.mtime)}"
+        self.info_label.setText(info)
+        self.viewer.setPlainText(content)
+
+    def _format_content(self, rec: FileRecord) -> str:
+        with rec.path.open("r", encoding="utf-8", errors="replace") as fh:
+            data = fh.read(self.MAX_PREVIEW_CHARS)
+            truncated = bool(fh.read(1))
+        if truncated:
+            # Pretty-printing a cut-off JSON/XML document would fail anyway
+            return data + "\n\n... [preview truncated at 1 MB — use Open Externally for the full file] ..."
 
         # Pretty format for JSON/XML
         content = data
@@ -436,14 +883,16 @@ class MessageViewerTab(QWidget):
                 parsed = json.loads(data)
                 content = json.dumps(parsed, indent=2)
             elif rec.path.suffix.lower() in {".xml"}:
-                dom = xml.dom.minidom.parseString(data.encode("utf-8"))
-                content = dom.toprettyxml()
+                import xml.etree.ElementTree as ET
+
+                # ElementTree avoids minidom's per-node DOM objects; keep comments
+                parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+                root = ET.fromstring(data.encode("utf-8"), parser=parser)
+                ET.indent(root)
+                content = ET.tostring(root, encoding="unicode")
         except Exception:
             content = data  # fallback to raw
-
-        info = f"{rec.path.name} — {rec.origin.upper()} — {rec.size} bytes — {self._fmt_mtime(rec.mtime)}"
-        self.info_label.setText(info)
-        self.viewer.setPlainText(content)
+        return content
 
     def _load_js8_content(self, msg: JS8Message):
         header = [
@@ -459,8 +908,6 @@ class MessageViewerTab(QWidget):
 
     def _fmt_mtime(self, mtime: float) -> str:
         try:
-            from datetime import datetime
-
             return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
         except Exception:
             return ""
@@ -485,32 +932,30 @@ class MessageViewerTab(QWidget):
                 return c
         return candidates[0]
 
-    def _local_js8_db(self) -> Path | None:
-        try:
-            root = Path(__file__).resolve().parents[2]
-            from freqinout.core.config_paths import get_config_dir
-
-            return get_config_dir() / "config" / "freqinout_nets.db"
-        except Exception as e:
-            log.debug("MessageViewer: failed to resolve local JS8 DB path: %s", e)
-            return None
-
     # ---------- JS8 Helpers ----------
 
     def _mark_js8_read(self, msg: JS8Message):
         if msg.state.upper() == "READ":
             return
         ts = time.time()
-        # Persist read state in local app DB (do not modify JS8Call inbox)
-        try:
-            self._save_js8_state(msg.msg_id, "READ", msg.utc_ts, read_ts=ts)
-            self._update_local_read(msg.msg_id, ts)
-        except Exception as e:
-            log.debug("MessageViewer: failed to persist JS8 READ state: %s", e)
+        # Persist read state in local app DB (do not modify JS8Call inbox); queued
+        # behind any running ingest so the JS8 worker is the only DB user
+        if not self._db_closed:
+            self._js8_pool.submit(self._persist_js8_read, msg.msg_id, msg.utc_ts, ts)
+        if self._js8_inflight:
+            # A load already running read the old state; reload once it lands
+            self._js8_again = True
         msg.state = "READ"
         msg.read_ts = ts
         self._populate_lists()
 
+    def _persist_js8_read(self, msg_id: int, last_seen_ts: float, read_ts: float) -> None:
+        try:
+            self._save_js8_state(msg_id, "READ", last_seen_ts, read_ts=read_ts)
+            self._update_local_read(msg_id, read_ts)
+        except Exception as e:
+            log.debug("MessageViewer: failed to persist JS8 READ state: %s", e)
+
     def _decode_form(self, form_id: str, responses: str, comment: str, raw: str = "") -> str:
         form_id = form_id.strip()
         if not form_id:
@@ -585,178 +1030,106 @@ class MessageViewerTab(QWidget):
     # ---------- JS8 state persistence (local DB) ---------- #
 
     def _load_js8_state_map(self) -> Dict[int, Tuple[str, float]]:
-        db_path = self._local_js8_db()
-        if not db_path or not db_path.exists():
-            return {}
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                "CREATE TABLE IF NOT EXISTS js8_inbox_state (id INTEGER PRIMARY KEY, state TEXT, last_seen REAL, read_ts REAL, last_ingested_id INTEGER)"
-            )
-            cur.execute("SELECT id, state, read_ts FROM js8_inbox_state")
-            rows = cur.fetchall()
-            conn.close()
+            self._ensure_local_js8_tables()
+            rows = self._db().execute(SQL_SELECT_JS8_STATE).fetchall()
             return {int(r[0]): ((r[1] or "").upper(), float(r[2] or 0.0)) for r in rows if r and r[0] is not None}
         except Exception as e:
             log.debug("MessageViewer: failed to load js8 state map: %s", e)
             return {}
 
     def _save_js8_state(self, msg_id: int, state: str, last_seen_ts: float = 0.0, read_ts: float = 0.0) -> None:
-        db_path = self._local_js8_db()
-        if not db_path:
-            return
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                "CREATE TABLE IF NOT EXISTS js8_inbox_state (id INTEGER PRIMARY KEY, state TEXT, last_seen REAL, read_ts REAL, last_ingested_id INTEGER)"
-            )
-            cur.execute(
-                "INSERT INTO js8_inbox_state (id, state, last_seen, read_ts) VALUES (?, ?, ?, ?) "
-                "ON CONFLICT(id) DO UPDATE SET state=excluded.state, last_seen=excluded.last_seen, read_ts=excluded.read_ts",
-                (int(msg_id), state.upper(), float(last_seen_ts or 0.0), float(read_ts or 0.0)),
-            )
-            conn.commit()
-            conn.close()
+            self._ensure_local_js8_tables()
+            with self._db() as conn:
+                conn.execute(
+                    SQL_UPSERT_JS8_STATE,
+                    (int(msg_id), state.upper(), float(last_seen_ts or 0.0), float(read_ts or 0.0)),
+                )
         except Exception as e:
             log.debug("MessageViewer: failed to save js8 state: %s", e)
 
     # ---------- JS8 message cache (local) ---------- #
 
     def _ensure_local_js8_tables(self) -> None:
-        db_path = self._local_js8_db()
-        if not db_path:
+        """
+        Create/migrate the local JS8 cache tables once per tab.
+        """
+        if self._js8_tables_ready:
             return
-        conn = sqlite3.connect(db_path)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS js8_messages (
-                id INTEGER PRIMARY KEY,
-                from_call TEXT,
-                to_call TEXT,
-                msg_type TEXT,
-                utc_str TEXT,
-                utc_ts REAL,
-                raw_text TEXT,
-                decoded_text TEXT,
-                state TEXT,
-                read_ts REAL
-            )
-            """
-        )
-        cur.execute(
-            "CREATE TABLE IF NOT EXISTS js8_inbox_state (id INTEGER PRIMARY KEY, state TEXT, last_seen REAL, read_ts REAL, last_ingested_id INTEGER)"
-        )
+        conn = self._db()
+        if conn is None:
+            return
+        conn.execute(SQL_CREATE_JS8_MESSAGES)
+        conn.execute(SQL_CREATE_JS8_INBOX_STATE)
         # Add columns if missing
-        try:
-            cur.execute("ALTER TABLE js8_messages ADD COLUMN read_ts REAL")
-        except Exception:
-            pass
-        try:
-            cur.execute("ALTER TABLE js8_inbox_state ADD COLUMN read_ts REAL")
-        except Exception:
-            pass
-        try:
-            cur.execute("ALTER TABLE js8_inbox_state ADD COLUMN last_ingested_id INTEGER")
-        except Exception:
-            pass
+        for ddl in (
+            "ALTER TABLE js8_messages ADD COLUMN read_ts REAL",
+            "ALTER TABLE js8_inbox_state ADD COLUMN read_ts REAL",
+            "ALTER TABLE js8_inbox_state ADD COLUMN last_ingested_id INTEGER",
+        ):
+            try:
+                conn.execute(ddl)
+            except Exception:
+                pass
         conn.commit()
-        conn.close()
+        self._js8_tables_ready = True
 
     def _local_max_js8_id(self) -> int:
-        db_path = self._local_js8_db()
-        if not db_path or not db_path.exists():
-            return 0
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute("SELECT MAX(id) FROM js8_messages")
-            row = cur.fetchone()
-            conn.close()
+            self._ensure_local_js8_tables()
+            row = self._db().execute(SQL_MAX_JS8_ID).fetchone()
             return int(row[0]) if row and row[0] is not None else 0
         except Exception:
             return 0
 
+    @staticmethod
+    def _js8_row(msg: JS8Message) -> tuple:
+        return (
+            msg.msg_id,
+            msg.from_call,
+            msg.to_call,
+            msg.msg_type,
+            msg.utc_str,
+            msg.utc_ts,
+            msg.raw_text,
+            msg.decoded_text,
+            msg.state,
+            msg.read_ts,
+        )
+
     def _insert_js8_local(self, msg: JS8Message) -> None:
-        db_path = self._local_js8_db()
-        if not db_path:
+        self._insert_js8_local_many([msg])
+
+    def _insert_js8_local_many(self, msgs: List[JS8Message]) -> None:
+        if not msgs:
             return
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                """
-                INSERT INTO js8_messages (id, from_call, to_call, msg_type, utc_str, utc_ts, raw_text, decoded_text, state, read_ts)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO NOTHING
-                """,
-                (
-                    msg.msg_id,
-                    msg.from_call,
-                    msg.to_call,
-                    msg.msg_type,
-                    msg.utc_str,
-                    msg.utc_ts,
-                    msg.raw_text,
-                    msg.decoded_text,
-                    msg.state,
-                    msg.read_ts,
-                ),
-            )
-            conn.commit()
-            conn.close()
+            self._ensure_local_js8_tables()
+            with self._db() as conn:
+                conn.executemany(SQL_INSERT_JS8_MESSAGE, [self._js8_row(m) for m in msgs])
         except Exception as e:
             log.debug("MessageViewer: failed to insert local js8 message: %s", e)
 
     def _update_local_decoded(self, msg_id: int, decoded: str) -> None:
-        db_path = self._local_js8_db()
-        if not db_path or not Path(db_path).exists():
-            return
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute("UPDATE js8_messages SET decoded_text=? WHERE id=?", (decoded, int(msg_id)))
-            conn.commit()
-            conn.close()
+            with self._db() as conn:
+                conn.execute(SQL_UPDATE_JS8_DECODED, (decoded, int(msg_id)))
         except Exception as e:
             log.debug("MessageViewer: failed to update local decoded text: %s", e)
 
     def _update_local_read(self, msg_id: int, read_ts: float) -> None:
-        db_path = self._local_js8_db()
-        if not db_path or not Path(db_path).exists():
-            return
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute("UPDATE js8_messages SET state='READ', read_ts=? WHERE id=?", (float(read_ts), int(msg_id)))
-            conn.commit()
-            conn.close()
+            with self._db() as conn:
+                conn.execute(SQL_UPDATE_JS8_READ, (float(read_ts), int(msg_id)))
         except Exception as e:
             log.debug("MessageViewer: failed to update local read state: %s", e)
 
-    def _load_js8_from_local(self) -> None:
-        self._ensure_local_js8_tables()
-        db_path = self._local_js8_db()
+    def _load_js8_from_local(self) -> List[JS8Message]:
         msgs: List[JS8Message] = []
-        if not db_path or not Path(db_path).exists():
-            self.js8_messages = msgs
-            self._populate_lists()
-            return
         try:
-            conn = sqlite3.connect(db_path)
-            cur = conn.cursor()
-            cur.execute(
-                """
-                SELECT id, from_call, to_call, msg_type, utc_str, utc_ts, raw_text, decoded_text, state, read_ts
-                FROM js8_messages
-                WHERE utc_ts IS NULL OR utc_ts >= ?
-                """,
-                (time.time() - JS8_MAX_AGE_SECONDS,),
-            )
-            rows = cur.fetchall()
-            conn.close()
+            self._ensure_local_js8_tables()
+            rows = self._db().execute(SQL_SELECT_JS8_RECENT, (time.time() - JS8_MAX_AGE_SECONDS,)).fetchall()
         except Exception as e:
             log.debug("MessageViewer: failed to load local js8 messages: %s", e)
             rows = []
@@ -787,18 +1160,15 @@ class MessageViewerTab(QWidget):
                         self._update_local_decoded(msg.msg_id, new_decoded)
             msgs.append(msg)
         msgs.sort(key=lambda m: (m.state != "UNREAD", m.utc_ts))
-        self.js8_messages = msgs
-        self._populate_lists()
+        return msgs
 
     def _ingest_js8_messages(self) -> None:
         inbox_path = self._inbox_path()
         if not inbox_path or not inbox_path.exists():
             return
-        self._ensure_local_js8_tables()
         max_local_id = self._local_max_js8_id()
         try:
-            conn = sqlite3.connect(inbox_path)
-            cur = conn.cursor()
+            cur = self._inbox_db(inbox_path).cursor()
             queries = [
                 ("inbox_v1", "id, json, type, value"),
                 ("inbox_v1", "rowid as id, json, type, value"),
@@ -816,13 +1186,14 @@ class MessageViewerTab(QWidget):
                     break
                 except Exception:
                     rows = []
-            conn.close()
+            cur.close()
         except Exception as e:
             log.debug("MessageViewer: JS8 ingest read failed: %s", e)
             rows = []
 
         state_map = self._load_js8_state_map()
         now_ts = time.time()
+        new_msgs: List[JS8Message] = []
         for row in rows:
             rid = row[0] if len(row) > 0 else 0
             if rid <= max_local_id:
@@ -844,8 +1215,6 @@ class MessageViewerTab(QWidget):
             to_call = (params.get("TO") or "").strip()
             utc_str = (params.get("UTC") or "").strip()
             try:
-                from datetime import datetime
-
                 utc_ts = datetime.strptime(utc_str, "%Y-%m-%d %H:%M:%S").timestamp()
             except Exception:
                 utc_ts = 0.0
@@ -880,7 +1249,9 @@ class MessageViewerTab(QWidget):
                 state=eff_state,
                 read_ts=read_ts,
             )
-            self._insert_js8_local(msg)
+            new_msgs.append(msg)
+        # One transaction for the whole batch
+        self._insert_js8_local_many(new_msgs)
 
     # ---------- Actions ----------
 
@@ -899,31 +1270,16 @@ class MessageViewerTab(QWidget):
         fn, _ = QFileDialog.getSaveFileName(self, "Export to PDF", self.current_record.path.stem + ".pdf", "PDF Files (*.pdf)")
         if not fn:
             return
-        try:
-            import textwrap
-
-            c = canvas.Canvas(fn, pagesize=letter)
-            c.setFont("Helvetica", 12)
-            width, height = letter
-            margin = 50
-            usable_width = width - 2 * margin
-            line_height = 14
-            # Roughly estimate characters per line at 12pt Helvetica (~6.5 px avg)
-            max_chars = max(40, int(usable_width / 6.5))
-            y = height - margin
-            for raw_line in text.splitlines():
-                wrapped = textwrap.wrap(raw_line, max_chars) or [""]
-                for line in wrapped:
-                    c.drawString(margin, y, line)
-                    y -= line_height
-                    if y < margin:
-                        c.showPage()
-                        c.setFont("Helvetica", 12)
-                        y = height - margin
-            c.save()
+        # One export at a time; _on_pdf_done re-enables the button
+        self.export_btn.setEnabled(False)
+        self._export_pool.submit(self._pdf_exporter.export, fn, text)
+
+    def _on_pdf_done(self, fn: str, error: str):
+        self.export_btn.setEnabled(True)
+        if error:
+            log.error("MessageViewer: PDF export failed: %s", error)
+        else:
             log.info("MessageViewer: exported PDF to %s", fn)
-        except Exception as e:
-            log.error("MessageViewer: PDF export failed: %s", e)
 
     # ---------- Settings ----------
 